@@ -4,44 +4,129 @@ Binance Spot Testnet GUI - Flask Version
 Main application entry point using Flask with AJAX-based refreshing.
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import JSONProvider
+import orjson
 import time
 import os
-import json
-
-from libs.exchange import BinanceClient
+import tempfile
+import threading
+import functools
+import gzip
+from dataclasses import dataclass
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from libs.exchange import BinanceClient, BinanceStream
 from libs.exchange.client import BinanceClientError
 
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify() and the tojson filter with orjson instead of the stdlib encoder."""
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self.OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.OPTIONS), mimetype='application/json')
+
+
+SECRET_KEY_PATH = 'resources/.secret_key'
+
+def load_secret_key() -> bytes:
+    """Get the session secret from SECRET_KEY, or from a key generated once and kept on disk."""
+    key = os.environ.get('SECRET_KEY')
+    if key:
+        return key.encode()
+    
+    try:
+        with open(SECRET_KEY_PATH, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    
+    # Write the key to a temp file and link it into place, so the file never exists empty
+    # and concurrently starting workers agree on whichever key was linked first
+    directory = os.path.dirname(SECRET_KEY_PATH)
+    os.makedirs(directory, exist_ok=True)
+    key = os.urandom(24)
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        os.link(tmp_path, SECRET_KEY_PATH)
+    except FileExistsError:
+        with open(SECRET_KEY_PATH, 'rb') as f:
+            return f.read()
+    finally:
+        os.unlink(tmp_path)
+    return key
+
 app = Flask(__name__)
-app.secret_key = os.urandom(24)
+app.json = OrjsonProvider(app)
+app.secret_key = load_secret_key()
 
 # ========== Configuration ==========
 
 CONFIG_PATH = 'resources/config.json'
+# Create the config directory once at startup rather than on every save
+os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+
+# (mtime_ns, parsed config) - the file is only re-read when it changes on disk
+_config_cache = (None, None)
+
+def _copy_config(config: dict) -> dict:
+    # Callers edit hidden_assets in place, so never hand out the cached list
+    return {**config, 'hidden_assets': list(config.get('hidden_assets', []))}
+
 
 def load_config() -> dict:
     """Load configuration from file."""
+    global _config_cache
     default_config = {
         'hide_small_assets': False,
         'hidden_assets': []
     }
     try:
-        if os.path.exists(CONFIG_PATH):
-            with open(CONFIG_PATH, 'r') as f:
-                config = json.load(f)
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return default_config
+    
+    cached_mtime, config = _config_cache
+    if mtime != cached_mtime:
+        try:
+            with open(CONFIG_PATH, 'rb') as f:
                 # Merge with defaults to ensure all keys exist
-                return {**default_config, **config}
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Error loading config: {e}")
-    return default_config
+                config = {**default_config, **orjson.loads(f.read())}
+        except (orjson.JSONDecodeError, IOError) as e:
+            print(f"Error loading config: {e}")
+            return default_config
+        _config_cache = (mtime, config)
+    
+    return _copy_config(config)
 
 
 def save_config(config: dict) -> bool:
     """Save configuration to file."""
+    global _config_cache
     try:
-        os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-        with open(CONFIG_PATH, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Write a private temp file and swap it in, so neither a concurrent load nor
+        # a concurrent save ever sees a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CONFIG_PATH), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, CONFIG_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        _config_cache = (os.stat(CONFIG_PATH).st_mtime_ns, _copy_config(config))
         return True
     except IOError as e:
         print(f"Error saving config: {e}")
@@ -49,91 +134,193 @@ def save_config(config: dict) -> bool:
 
 # Global client instance
 _client = None
+_client_lock = threading.Lock()
 
 def get_client() -> BinanceClient:
     """Get or create the Binance client instance."""
     global _client
     if _client is None:
-        _client = BinanceClient()
+        with _client_lock:
+            if _client is None:
+                _client = BinanceClient()
     return _client
 
 
+# Shared worker pool for fanning out independent Binance REST calls
+_pool = ThreadPoolExecutor(max_workers=8)
+
+
+# Websocket stream instance (prices + user data)
+_stream = None
+_stream_lock = threading.Lock()
+
+def get_stream() -> BinanceStream | None:
+    """Get the websocket stream if it is live, (re)connecting it when needed."""
+    global _stream
+    if _stream is None:
+        with _stream_lock:
+            if _stream is None:
+                _stream = BinanceStream(get_client(), on_execution=log_execution_report)
+    return _stream if _stream.ensure_running() else None
+
+
 # ========== Cache with TTL ==========
 
 class TTLCache:
-    """Simple TTL cache for API data."""
-    def __init__(self):
-        self._cache = {}
-        self._timestamps = {}
+    """Simple TTL cache for API data, bounded by LRU eviction."""
+    def __init__(self, maxsize: int = 128):
+        self._cache = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._key_locks = {}
     
-    def get(self, key: str, ttl: int = 5):
+    def get(self, key: str):
         """Get cached value if not expired."""
-        if key in self._cache:
-            if time.time() - self._timestamps.get(key, 0) < ttl:
-                return self._cache[key]
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                return entry[1]
         return None
     
-    def set(self, key: str, value):
-        """Set cache value with current timestamp."""
-        self._cache[key] = value
-        self._timestamps[key] = time.time()
+    def set(self, key: str, value, ttl: float = 5):
+        """Set cache value, expiring after ttl seconds."""
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+    
+    def get_or_fetch(self, key: str, fetch, ttl: float = 5, force: bool = False):
+        """Get cached value, or fetch it once while concurrent callers for the key wait."""
+        if not force:
+            value = self.get(key)
+            if value is not None:
+                return value
+        
+        # [lock, callers holding or waiting on it]; dropped by the last caller so
+        # user-supplied keys can't grow the table without bound
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = [threading.Lock(), 0]
+            key_lock[1] += 1
+        
+        try:
+            with key_lock[0]:
+                # Another caller may have filled the entry while we waited
+                value = None if force else self.get(key)
+                if value is None:
+                    value = fetch()
+                    self.set(key, value, ttl=ttl)
+        finally:
+            with self._lock:
+                key_lock[1] -= 1
+                if key_lock[1] == 0:
+                    del self._key_locks[key]
+        return value
+    
+    def delete(self, key: str):
+        """Drop a single cached entry."""
+        with self._lock:
+            self._cache.pop(key, None)
     
     def clear(self):
         """Clear all cached data."""
-        self._cache.clear()
-        self._timestamps.clear()
+        with self._lock:
+            self._cache.clear()
 
 cache = TTLCache()
 
 
 # ========== Activity Log ==========
 
-activity_log = []
+# Newest entries first; only the last 50 are kept
+activity_log = deque(maxlen=50)
+# Signalled on every new log entry or order update so /api/stream can push it
+_events = threading.Condition()
+_log_seq = 0
+# Log entry ids carry a per-process epoch, so ids from before a restart are never reused
+_LOG_EPOCH = os.urandom(4).hex()
+_orders_seq = 0
 
 def add_log(message: str, level: str = "info"):
     """Add entry to activity log."""
-    global activity_log
-    activity_log.insert(0, {
-        "msg": message,
-        "level": level,
-        "time": time.strftime("%H:%M:%S")
-    })
-    # Keep only last 50 entries
-    if len(activity_log) > 50:
-        activity_log = activity_log[:50]
+    global _log_seq
+    with _events:
+        _log_seq += 1
+        activity_log.appendleft({
+            "id": f"{_LOG_EPOCH}-{_log_seq}",
+            "msg": message,
+            "level": level,
+            "time": time.strftime("%H:%M:%S")
+        })
+        _events.notify_all()
+
+
+def notify_orders_changed():
+    """Tell /api/stream listeners that the open orders changed."""
+    global _orders_seq
+    with _events:
+        _orders_seq += 1
+        _events.notify_all()
+
+
+def log_execution_report(event: dict):
+    """Add an activity log entry for an order update pushed by the user data stream."""
+    status = event.get('X', 'UNKNOWN')
+    if status == 'FILLED':
+        level = "success"
+    elif status in ('CANCELED', 'EXPIRED', 'EXPIRED_IN_MATCH', 'REJECTED'):
+        level = "warning"
+    else:
+        level = "info"
+    add_log(f"Order Update: {event.get('s')} {event.get('S')} {event.get('o')} {status}, "
+            f"Filled: {event.get('z')}/{event.get('q')}", level)
+    cache.delete(f"order_history:{event.get('s')}")
+    notify_orders_changed()
 
 
 # ========== Data Fetching ==========
 
+def index_balances(account: dict) -> dict:
+    """Attach a balances_by_asset lookup to an account snapshot."""
+    BinanceClient.get_balances_by_asset(account)
+    return account
+
+
+def fetch_account_info() -> dict:
+    """Fetch account info over REST, indexed by asset."""
+    return index_balances(get_client().get_account_info())
+
+
 def get_account_info(force_refresh: bool = False):
-    """Get account info with caching."""
-    if not force_refresh:
-        cached = cache.get('account_info', ttl=2)
-        if cached is not None:
-            return cached
+    """Get account info from the user data stream, falling back to cached REST."""
+    # A forced refresh reads REST: right after an order the stream may not have delivered the fill yet
+    stream = None if force_refresh else get_stream()
+    if stream is not None:
+        data = stream.get_account_info()
+        if data is not None:
+            return data
     
     try:
-        client = get_client()
-        data = client.get_account_info()
-        cache.set('account_info', data)
-        return data
+        return cache.get_or_fetch('account_info', fetch_account_info, ttl=2, force=force_refresh)
     except BinanceClientError as e:
         add_log(f"Error fetching account: {e}", "error")
         return None
 
 
 def get_prices(force_refresh: bool = False):
-    """Get all prices with caching."""
-    if not force_refresh:
-        cached = cache.get('prices', ttl=5)
-        if cached is not None:
-            return cached
+    """Get all prices from the ticker stream, falling back to cached REST."""
+    stream = get_stream()
+    if stream is not None:
+        data = stream.get_prices()
+        if data is not None:
+            return data
     
     try:
         client = get_client()
-        data = client.get_all_prices()
-        cache.set('prices', data)
-        return data
+        return cache.get_or_fetch('prices', client.get_all_prices, ttl=5, force=force_refresh)
     except BinanceClientError as e:
         add_log(f"Error fetching prices: {e}", "error")
         return {}
@@ -149,37 +336,86 @@ def get_open_orders(symbol=None):
         return []
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_order_time(seconds: int) -> str:
+    # Order timestamps never change, so repeat lookups across requests are free
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
+
+def _format_order(order: dict) -> dict:
+    """Add time_formatted and normalize price for display."""
+    t = order.get('time')
+    if t is not None:
+        order['time_formatted'] = _format_order_time(t // 1000)
+    
+    # Format price - convert from string to float with 4 decimal places
+    # For market orders that filled, price is "0", so use the average fill price instead
+    price = float(order.get('price') or 0)
+    if price == 0:
+        executed_qty = float(order.get('executedQty') or 0)
+        if executed_qty > 0:
+            price = float(order.get('cummulativeQuoteQty') or 0) / executed_qty
+    
+    order['price'] = f"{price:.4f}"
+    return order
+
+
 def get_all_orders(symbol: str):
-    """Fetch order history for a symbol."""
+    """Fetch order history for a symbol, formatted once per fetch and cached."""
+    def fetch():
+        return [_format_order(o) for o in get_client().get_all_orders(symbol)]
+    
     try:
-        client = get_client()
-        return client.get_all_orders(symbol)
+        # History rarely changes; order actions and execution reports invalidate it
+        return cache.get_or_fetch(f'order_history:{symbol}', fetch, ttl=30)
     except BinanceClientError:
         return []
 
 
 # ========== Helper Functions ==========
 
+@functools.lru_cache(maxsize=128)
+def _error_body(message: str) -> bytes:
+    return orjson.dumps({'success': False, 'error': message})
+
+
+def error_response(message: str, status: int = 400) -> Response:
+    """Failure response for the action routes; bodies for repeated messages are encoded once."""
+    return Response(_error_body(message), status=status, mimetype='application/json')
+
+
+_ZERO = "0,00"
+# Swap thousands and decimal separators in a single pass
+_SWAP = str.maketrans({',': '.', '.': ','})
+
 def format_number(value: float) -> str:
     """Format number with European style (comma as decimal separator)."""
-    if value is None:
-        return "0,00"
-    return f"{value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    if not value:
+        return _ZERO
+    return f"{value:,.2f}".translate(_SWAP)
 
 
-def calculate_portfolio_data():
+def get_sorted_symbols() -> tuple[str, ...]:
+    """Get the sorted trading symbols, cached by the client alongside exchange info."""
+    try:
+        return get_client().get_all_symbols()
+    except BinanceClientError as e:
+        add_log(f"Error fetching symbols: {e}", "error")
+        return ()
+
+
+def calculate_portfolio_data(force_refresh: bool = False):
     """Calculate all portfolio data for the dashboard."""
-    account = get_account_info()
+    # Independent round trips: fetch account info on the pool while prices load here
+    account_future = _pool.submit(get_account_info, force_refresh)
     prices = get_prices()
+    account = account_future.result()
     
     if not account:
         return None
     
     client = get_client()
-    balances = account.get('balances', [])
-    
-    # Filter non-zero balances
-    assets = [b for b in balances if float(b['free']) > 0 or float(b['locked']) > 0]
+    assets = client.get_nonzero_assets(account)
     
     # Calculate portfolio value
     usdt_balance, portfolio_value, asset_data = client.calculate_portfolio_value(assets, prices)
@@ -188,11 +424,145 @@ def calculate_portfolio_data():
         'usdt_balance': usdt_balance,
         'portfolio_value': portfolio_value,
         'assets': asset_data,
-        'all_symbols': sorted(list(prices.keys())),
+        'all_symbols': get_sorted_symbols(),
         'prices': prices
     }
 
 
+# ========== Order Placement ==========
+
+# Binance rejects orders below ~10 USDT notional
+MIN_ORDER_VALUE = 10.0
+
+
+@dataclass
+class OrderRequest:
+    """Buy/sell form payload with numeric fields already coerced."""
+    symbol: str
+    order_type: str
+    quantity: float
+    total_usdt: float
+    price: float
+    current_price: float
+    
+    @property
+    def is_market(self) -> bool:
+        return self.order_type == "MARKET"
+
+
+class OrderRejected(Exception):
+    """Order input rejected before it reaches the exchange."""
+    def __init__(self, message: str, error: str):
+        super().__init__(message)
+        self.error = error
+
+
+def _parse_order_payload(data: dict) -> OrderRequest:
+    return OrderRequest(
+        symbol=data.get('symbol'),
+        order_type=data.get('order_type', 'LIMIT'),
+        quantity=float(data.get('quantity', 0)),
+        total_usdt=float(data.get('total_usdt', 0)),
+        price=float(data.get('price', 0)),
+        current_price=float(data.get('current_price', 0))
+    )
+
+
+def _order_error_message(e: BinanceClientError, client: BinanceClient, symbol: str) -> str:
+    """Map an exchange rejection to a user-facing message."""
+    if e.is_notional_error():
+        return "Order value too small (min ~10 USDT)"
+    elif e.is_insufficient_balance():
+        return "Insufficient balance for this order"
+    elif e.is_market_lot_size_error():
+        max_qty = client.get_max_market_lot_size(symbol)
+        return f"Quantity exceeds max market lot size ({max_qty})"
+    elif e.is_lot_size_error():
+        return "Invalid quantity for this symbol"
+    elif e.is_liquidity_error():
+        return "No liquidity available for this order"
+    return e.get_user_message()
+
+
+def _buy_quantity(client: BinanceClient, req: OrderRequest):
+    adjusted_qty = client.adjust_quantity(req.symbol, req.quantity, is_market_order=req.is_market)
+    if adjusted_qty <= 0:
+        raise OrderRejected("Quantity too small after adjustment.", 'Quantity too small')
+    
+    client.place_order(
+        symbol=req.symbol,
+        side="BUY",
+        order_type=req.order_type,
+        quantity=adjusted_qty,
+        price=None if req.is_market else req.price
+    )
+    return adjusted_qty
+
+
+def _buy_market_total(client: BinanceClient, req: OrderRequest):
+    client.place_order(
+        symbol=req.symbol,
+        side="BUY",
+        order_type=req.order_type,
+        quote_order_qty=req.total_usdt
+    )
+    return f"{req.total_usdt} USDT"
+
+
+def _buy_limit_total(client: BinanceClient, req: OrderRequest):
+    # LIMIT: Calculate quantity from total
+    if req.price <= 0:
+        raise OrderRejected("Price must be > 0 to calculate quantity from total.", 'Price must be > 0')
+    
+    adjusted_qty = client.adjust_quantity(req.symbol, req.total_usdt / req.price)
+    if adjusted_qty <= 0:
+        raise OrderRejected("Calculated quantity too small.", 'Quantity too small')
+    
+    client.place_order(
+        symbol=req.symbol,
+        side="BUY",
+        order_type=req.order_type,
+        quantity=adjusted_qty,
+        price=req.price
+    )
+    return adjusted_qty
+
+
+# (order_type, input_mode) -> handler returning the quantity to log
+_BUY_HANDLERS = {
+    ('MARKET', 'quantity'): _buy_quantity,
+    ('LIMIT', 'quantity'): _buy_quantity,
+    ('MARKET', 'total'): _buy_market_total,
+    ('LIMIT', 'total'): _buy_limit_total,
+}
+
+
+# ========== Response Compression ==========
+
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 6
+COMPRESS_MIMETYPES = frozenset({'application/json', 'text/html'})
+
+@app.after_request
+def compress_response(response: Response) -> Response:
+    """Gzip larger JSON/HTML responses when the client accepts it."""
+    if (response.status_code != 200
+            or response.is_streamed
+            or response.mimetype not in COMPRESS_MIMETYPES
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '')):
+        return response
+    
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
 # ========== Page Routes ==========
 
 @app.route('/')
@@ -212,7 +582,7 @@ def index():
         }
     
     config = load_config()
-    hidden_assets = config.get('hidden_assets', [])
+    hidden_assets = frozenset(config.get('hidden_assets', ()))
     
     # Filter out hidden assets from the display
     filtered_assets = [a for a in data['assets'] if a['Asset'] not in hidden_assets]
@@ -252,7 +622,7 @@ def api_save_config():
         add_log("Configuration saved", "success")
         return jsonify({'success': True, 'config': config})
     else:
-        return jsonify({'success': False, 'error': 'Failed to save config'}), 500
+        return error_response('Failed to save config', 500)
 
 
 @app.route('/api/config/hide_asset', methods=['POST'])
@@ -262,7 +632,7 @@ def api_hide_asset():
     asset = data.get('asset')
     
     if not asset:
-        return jsonify({'success': False, 'error': 'Asset name required'}), 400
+        return error_response('Asset name required')
     
     config = load_config()
     if asset not in config['hidden_assets']:
@@ -280,7 +650,7 @@ def api_unhide_asset():
     asset = data.get('asset')
     
     if not asset:
-        return jsonify({'success': False, 'error': 'Asset name required'}), 400
+        return error_response('Asset name required')
     
     config = load_config()
     if asset in config['hidden_assets']:
@@ -291,38 +661,74 @@ def api_unhide_asset():
     return jsonify({'success': True, 'hidden_assets': config['hidden_assets']})
 
 
-@app.route('/api/refresh')
-def api_refresh():
-    """Refresh all data and return updated dashboard info."""
-    cache.clear()
-    data = calculate_portfolio_data()
+def format_portfolio(data: dict, config: dict) -> dict:
+    """Format portfolio data for JSON, excluding hidden assets."""
+    hidden_assets = frozenset(config.get('hidden_assets', ()))
     
-    if data is None:
-        return jsonify({'error': 'Failed to fetch data'}), 500
-    
-    config = load_config()
-    hidden_assets = config.get('hidden_assets', [])
-    
-    # Format asset data for JSON, excluding hidden assets
+    # Local bindings keep the per-asset loop on fast local lookups
+    fmt = format_number
     formatted_assets = []
+    append = formatted_assets.append
     for asset in data['assets']:
-        if asset['Asset'] in hidden_assets:
+        name = asset['Asset']
+        if name in hidden_assets:
             continue
-        formatted_assets.append({
-            'Asset': asset['Asset'],
-            'Free': format_number(asset['Free']),
-            'Locked': format_number(asset['Locked']),
-            'Total': format_number(asset['Total']),
-            'Value': format_number(asset['Value (USDT)']),
-            'RawValue': asset['Value (USDT)']
+        value = asset['Value (USDT)']
+        append({
+            'Asset': name,
+            'Free': fmt(asset['Free']),
+            'Locked': fmt(asset['Locked']),
+            'Total': fmt(asset['Total']),
+            'Value': fmt(value),
+            'RawValue': value
         })
     
-    return jsonify({
+    return {
         'usdt_balance': format_number(data['usdt_balance']),
         'portfolio_value': format_number(data['portfolio_value']),
         'assets': formatted_assets,
         'all_symbols': data['all_symbols'],
         'config': config
+    }
+
+
+@app.route('/api/refresh')
+def api_refresh():
+    """Refresh all data and return updated dashboard info."""
+    cache.clear()
+    data = calculate_portfolio_data(force_refresh=True)
+    
+    if data is None:
+        return jsonify({'error': 'Failed to fetch data'}), 500
+    
+    return jsonify(format_portfolio(data, load_config()))
+
+
+@app.route('/api/dashboard')
+def api_dashboard():
+    """Get portfolio, open orders, activity log and the selected symbol's price in one response."""
+    refresh = bool(request.args.get('refresh'))
+    if refresh:
+        cache.clear()
+    symbol = request.args.get('symbol')
+    
+    # Open orders are independent of the portfolio fetch, so overlap the two round trips
+    open_orders = _pool.submit(get_open_orders)
+    data = calculate_portfolio_data(force_refresh=refresh)
+    
+    if data is None:
+        return jsonify({'error': 'Failed to fetch data'}), 500
+    
+    price = None
+    if symbol:
+        value = data['prices'].get(symbol, 0.0)
+        price = {'symbol': symbol, 'price': value, 'formatted': format_number(value)}
+    
+    return jsonify({
+        'portfolio': format_portfolio(data, load_config()),
+        'open_orders': open_orders.result(),
+        'log': list(activity_log),
+        'price': price
     })
 
 
@@ -331,11 +737,13 @@ def api_get_price(symbol):
     """Get current price for a symbol."""
     prices = get_prices()
     price = prices.get(symbol, 0.0)
-    return jsonify({
+    response = jsonify({
         'symbol': symbol,
         'price': price,
         'formatted': format_number(price)
     })
+    response.headers['Cache-Control'] = 'public, max-age=2'
+    return response
 
 
 @app.route('/api/open_orders')
@@ -348,157 +756,164 @@ def api_open_orders():
 @app.route('/api/order_history/<symbol>')
 def api_order_history(symbol):
     """Get order history for a symbol."""
-    orders = get_all_orders(symbol)
-    
-    # Format timestamps and price
-    for order in orders:
-        if 'time' in order:
-            order['time_formatted'] = time.strftime('%Y-%m-%d %H:%M:%S', 
-                time.localtime(order['time'] / 1000))
-        
-        # Format price - convert from string to float with 4 decimal places
-        # For market orders that filled, price may be "0", so calculate from fills
-        price = float(order.get('price', 0))
-        if price == 0 and order.get('executedQty', 0) and float(order.get('executedQty', 0)) > 0:
-            # For filled orders with price 0, try to get average price from cummulativeQuoteQty
-            cumulative_quote = float(order.get('cummulativeQuoteQty', 0))
-            executed_qty = float(order.get('executedQty', 0))
-            if executed_qty > 0:
-                price = cumulative_quote / executed_qty
-        
-        order['price'] = f"{price:.4f}"
-    
-    return jsonify({'orders': orders})
+    return jsonify({'orders': get_all_orders(symbol)})
 
 
 @app.route('/api/activity_log')
 def api_activity_log():
-    """Get activity log entries."""
-    return jsonify({'log': activity_log})
+    """Get activity log entries, answering 304 if the client already has the latest."""
+    # The sequence number changes with every entry; the epoch keeps ETags unique across restarts
+    etag = f"{_LOG_EPOCH}-{_log_seq}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify({'log': list(activity_log)})
+    response.set_etag(etag)
+    return response
+
+
+SSE_PRICE_INTERVAL = 2
+SSE_PING_INTERVAL = 15
+# Each open stream holds a server thread; ending it periodically hands the thread back,
+# and EventSource reconnects, resuming from the Last-Event-ID it was sent
+SSE_MAX_AGE = 300
+SSE_RETRY_MS = 1000
+
+def _sse(event: str, data, event_id: str | None = None) -> str:
+    frame = f"event: {event}\ndata: {app.json.dumps(data)}\n\n"
+    return f"id: {event_id}\n{frame}" if event_id else frame
+
+
+def _resume_log_seq(last_event_id: str | None, current: int) -> int:
+    """Log sequence number to resume a reconnecting stream from, or current for a new one."""
+    epoch, _, seq = (last_event_id or '').partition('-')
+    if epoch == _LOG_EPOCH and seq.isdigit():
+        return min(int(seq), current)
+    return current
+
+
+@app.route('/api/stream')
+def api_stream():
+    """Push new log entries, open order changes and the symbol's price as Server-Sent Events."""
+    symbol = request.args.get('symbol')
+    last_event_id = request.headers.get('Last-Event-ID')
+    
+    def generate():
+        with _events:
+            log_seq = _resume_log_seq(last_event_id, _log_seq)
+            orders_seq = _orders_seq
+        last_price = None
+        next_price = 0.0
+        last_sent = time.monotonic()
+        deadline = last_sent + SSE_MAX_AGE
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        
+        while time.monotonic() < deadline:
+            with _events:
+                _events.wait(timeout=SSE_PRICE_INTERVAL)
+                new_logs = min(_log_seq - log_seq, activity_log.maxlen)
+                entries = list(activity_log)[:new_logs] if new_logs else []
+                orders_changed = _orders_seq != orders_seq
+                log_seq, orders_seq = _log_seq, _orders_seq
+            
+            frames = [_sse('log', entry, entry['id']) for entry in reversed(entries)]
+            if orders_changed:
+                frames.append(_sse('orders', {}))
+            
+            now = time.monotonic()
+            if symbol and now >= next_price:
+                next_price = now + SSE_PRICE_INTERVAL
+                price = get_prices().get(symbol)
+                if price is not None and price != last_price:
+                    last_price = price
+                    frames.append(_sse('price', {
+                        'symbol': symbol,
+                        'price': price,
+                        'formatted': format_number(price)
+                    }))
+            
+            if frames:
+                last_sent = now
+                yield ''.join(frames)
+            elif now - last_sent >= SSE_PING_INTERVAL:
+                # Comment frame keeps proxies from closing the idle connection
+                last_sent = now
+                yield ': ping\n\n'
+    
+    return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
 
 
 @app.route('/api/buy', methods=['POST'])
 def api_buy():
     """Place a buy order."""
-    data = request.get_json()
+    req = _parse_order_payload(request.get_json())
+    client = get_client()
     
-    symbol = data.get('symbol')
-    order_type = data.get('order_type', 'LIMIT')
-    quantity = float(data.get('quantity', 0))
-    total_usdt = float(data.get('total_usdt', 0))
-    price = float(data.get('price', 0))
+    if req.quantity > 0:
+        input_mode = 'quantity'
+    elif req.total_usdt > 0:
+        input_mode = 'total'
+    else:
+        add_log("Buy Failed: Please enter Quantity or Total (USDT).", "error")
+        return error_response('Enter quantity or total')
     
-    client = get_client()
+    handler = _BUY_HANDLERS.get((req.order_type, input_mode))
+    if handler is None:
+        add_log(f"Buy Failed: Unsupported order type {req.order_type}.", "error")
+        return error_response('Unsupported order type')
+    
+    # Reject orders that can't pass the NOTIONAL filter before any exchange call
+    if input_mode == 'quantity':
+        estimated_value = req.quantity * (req.current_price if req.is_market else req.price)
+    else:
+        estimated_value = req.total_usdt
+    if 0 < estimated_value < MIN_ORDER_VALUE:
+        add_log(f"Buy Failed: Order value {estimated_value:.2f} USDT is too small (min ~10 USDT).", "error")
+        return error_response(f'Order value {estimated_value:.2f} USDT too small')
     
     try:
-        qty_to_log = 0
-        
-        if quantity > 0:
-            is_market = order_type == "MARKET"
-            adjusted_qty = client.adjust_quantity(symbol, quantity, is_market_order=is_market)
-            
-            if adjusted_qty <= 0:
-                add_log("Buy Failed: Quantity too small after adjustment.", "error")
-                return jsonify({'success': False, 'error': 'Quantity too small'}), 400
-            
-            client.place_order(
-                symbol=symbol,
-                side="BUY",
-                order_type=order_type,
-                quantity=adjusted_qty,
-                price=price if order_type == "LIMIT" else None
-            )
-            qty_to_log = adjusted_qty
-            
-        elif total_usdt > 0:
-            if order_type == "MARKET":
-                client.place_order(
-                    symbol=symbol,
-                    side="BUY",
-                    order_type=order_type,
-                    quote_order_qty=total_usdt
-                )
-                qty_to_log = f"{total_usdt} USDT"
-            else:
-                # LIMIT: Calculate quantity from total
-                if price <= 0:
-                    add_log("Buy Failed: Price must be > 0 to calculate quantity from total.", "error")
-                    return jsonify({'success': False, 'error': 'Price must be > 0'}), 400
-                
-                calc_qty = total_usdt / price
-                adjusted_qty = client.adjust_quantity(symbol, calc_qty)
-                
-                if adjusted_qty <= 0:
-                    add_log("Buy Failed: Calculated quantity too small.", "error")
-                    return jsonify({'success': False, 'error': 'Quantity too small'}), 400
-                
-                client.place_order(
-                    symbol=symbol,
-                    side="BUY",
-                    order_type=order_type,
-                    quantity=adjusted_qty,
-                    price=price
-                )
-                qty_to_log = adjusted_qty
-        else:
-            add_log("Buy Failed: Please enter Quantity or Total (USDT).", "error")
-            return jsonify({'success': False, 'error': 'Enter quantity or total'}), 400
-        
-        add_log(f"Buy Order Placed: {symbol}, Qty: {qty_to_log}", "success")
-        cache.clear()  # Clear cache to refresh data
-        return jsonify({'success': True})
-        
+        qty_to_log = handler(client, req)
+    except OrderRejected as e:
+        add_log(f"Buy Failed: {e}", "error")
+        return error_response(e.error)
     except BinanceClientError as e:
-        if e.is_notional_error():
-            error_msg = "Order value too small (min ~10 USDT)"
-        elif e.is_insufficient_balance():
-            error_msg = "Insufficient balance for this order"
-        elif e.is_lot_size_error():
-            error_msg = "Invalid quantity for this symbol"
-        else:
-            error_msg = e.get_user_message()
+        error_msg = _order_error_message(e, client, req.symbol)
         add_log(f"Buy Failed: {error_msg}", "error")
-        return jsonify({'success': False, 'error': error_msg}), 400
+        return error_response(error_msg)
+    
+    add_log(f"Buy Order Placed: {req.symbol}, Qty: {qty_to_log}", "success")
+    cache.clear()  # Clear cache to refresh data
+    notify_orders_changed()
+    return jsonify({'success': True})
 
 
 @app.route('/api/sell', methods=['POST'])
 def api_sell():
     """Place a sell order."""
-    data = request.get_json()
-    
-    symbol = data.get('symbol')
-    order_type = data.get('order_type', 'LIMIT')
-    quantity = float(data.get('quantity', 0))
-    price = float(data.get('price', 0))
-    current_price = float(data.get('current_price', 0))
+    req = _parse_order_payload(request.get_json())
+    symbol, quantity, price = req.symbol, req.quantity, req.price
     
     # Check estimated value
-    if order_type == "LIMIT":
-        estimated_value = quantity * price
-    else:
-        estimated_value = quantity * current_price
-    
-    if estimated_value < 10.0:
+    estimated_value = quantity * (req.current_price if req.is_market else price)
+    if estimated_value < MIN_ORDER_VALUE:
         add_log(f"Sell Failed: Order value {estimated_value:.2f} USDT is too small (min ~10 USDT).", "error")
-        return jsonify({'success': False, 'error': f'Order value {estimated_value:.2f} USDT too small'}), 400
+        return error_response(f'Order value {estimated_value:.2f} USDT too small')
     
     client = get_client()
     
     try:
-        is_market = order_type == "MARKET"
-        
         # Check market lot size constraints for market orders
-        if is_market:
+        if req.is_market:
             max_market_qty = client.get_max_market_lot_size(symbol)
             if max_market_qty > 0 and quantity > max_market_qty:
                 add_log(f"Sell Warning: Quantity {quantity} exceeds max market lot size {max_market_qty} for {symbol}. Order will be reduced.", "warning")
         
-        adjusted_qty = client.adjust_quantity(symbol, quantity, is_market_order=is_market)
+        adjusted_qty = client.adjust_quantity(symbol, quantity, is_market_order=req.is_market)
         
         if adjusted_qty <= 0:
-            min_qty = client.get_min_market_lot_size(symbol) if is_market else 0
+            min_qty = client.get_min_market_lot_size(symbol) if req.is_market else 0
             add_log(f"Sell Failed: Quantity too small after adjustment (min: {min_qty}).", "error")
-            return jsonify({'success': False, 'error': 'Quantity too small'}), 400
+            return error_response('Quantity too small')
         
         # Log if quantity was significantly reduced
         if adjusted_qty < quantity * 0.99:  # More than 1% reduction
@@ -507,9 +922,9 @@ def api_sell():
         result = client.place_order(
             symbol=symbol,
             side="SELL",
-            order_type=order_type,
+            order_type=req.order_type,
             quantity=adjusted_qty,
-            price=price if order_type == "LIMIT" else None
+            price=None if req.is_market else price
         )
         
         # Check order status from response
@@ -529,24 +944,13 @@ def api_sell():
             add_log(f"Sell Order {order_status}: {symbol}, Qty: {adjusted_qty}", "success")
         
         cache.clear()
+        notify_orders_changed()
         return jsonify({'success': True, 'status': order_status})
         
     except BinanceClientError as e:
-        if e.is_notional_error():
-            error_msg = "Order value too small (min ~10 USDT)"
-        elif e.is_insufficient_balance():
-            error_msg = "Insufficient balance for this order"
-        elif e.is_market_lot_size_error():
-            max_qty = client.get_max_market_lot_size(symbol)
-            error_msg = f"Quantity exceeds max market lot size ({max_qty})"
-        elif e.is_lot_size_error():
-            error_msg = "Invalid quantity for this symbol"
-        elif e.is_liquidity_error():
-            error_msg = "No liquidity available for this order"
-        else:
-            error_msg = e.get_user_message()
+        error_msg = _order_error_message(e, client, symbol)
         add_log(f"Sell Failed: {error_msg}", "error")
-        return jsonify({'success': False, 'error': error_msg}), 400
+        return error_response(error_msg)
 
 
 @app.route('/api/cancel_order', methods=['POST'])
@@ -559,7 +963,7 @@ def api_cancel_order():
     
     if not order_id or not symbol:
         add_log("Cancel Failed: Order ID and Symbol are required.", "error")
-        return jsonify({'success': False, 'error': 'Order ID and Symbol required'}), 400
+        return error_response('Order ID and Symbol required')
     
     client = get_client()
     
@@ -567,10 +971,93 @@ def api_cancel_order():
         client.cancel_order(symbol=symbol, order_id=order_id)
         add_log(f"Order {order_id} cancelled", "success")
         cache.clear()
+        notify_orders_changed()
         return jsonify({'success': True})
     except BinanceClientError as e:
         add_log(f"Cancel Failed: {e}", "error")
-        return jsonify({'success': False, 'error': str(e)}), 400
+        return error_response(str(e))
+
+
+def _sell_asset(client: BinanceClient, asset_name: str, free_amt: float, pair: str):
+    """Market-sell an asset in max-lot batches. Returns a dust tuple if it could not be sold."""
+    try:
+        min_qty = client.get_min_market_lot_size(pair)
+        max_qty = client.get_max_market_lot_size(pair)
+        # Every batch of at least max_qty adjusts to the same size, so compute it once
+        full_batch = None
+        if max_qty != float('inf'):
+            full_batch = client.adjust_quantity(pair, max_qty, is_market_order=True)
+        
+        remaining = free_amt
+        total_sold = 0.0
+        
+        while remaining > 0:
+            if full_batch is not None and remaining >= max_qty:
+                qty_to_sell = full_batch
+            else:
+                qty_to_sell = client.adjust_quantity(pair, remaining, is_market_order=True)
+            
+            if qty_to_sell <= 0 or qty_to_sell < min_qty:
+                if total_sold == 0:
+                    return (asset_name, remaining, pair)
+                break
+            
+            result = client.place_order(
+                symbol=pair,
+                side='SELL',
+                order_type='MARKET',
+                quantity=qty_to_sell
+            )
+            
+            status = result.get('status', '')
+            executed_qty = float(result.get('executedQty', 0))
+            
+            if status == 'EXPIRED' or executed_qty == 0:
+                add_log(f"Cannot sell {asset_name}: No liquidity on testnet.", "warning")
+                break
+            
+            total_sold += executed_qty
+            remaining -= executed_qty
+            add_log(f"Sold {executed_qty} {asset_name}", "success")
+            
+            # Order pacing is left to the client's ORDERS rate limiter
+            if remaining <= 0 or remaining < min_qty:
+                break
+                
+    except BinanceClientError as e:
+        add_log(f"Failed to sell {asset_name}: {e}", "error")
+    return None
+
+
+def _buy_dust(client: BinanceClient, asset_name: str, pair: str) -> bool:
+    """Buy ~11 USDT of a dust asset so the whole balance clears the minimum notional."""
+    try:
+        buy_result = client.place_order(
+            symbol=pair,
+            side='BUY',
+            order_type='MARKET',
+            quote_order_qty=11.0
+        )
+        return not (buy_result.get('status') == 'EXPIRED' or float(buy_result.get('executedQty', 0)) == 0)
+    except BinanceClientError as e:
+        add_log(f"Failed to sweep {asset_name}: {e}", "warning")
+        return False
+
+
+def _sell_dust(client: BinanceClient, asset_name: str, pair: str, balance: float):
+    """Sell the full (topped-up) balance of a dust asset."""
+    try:
+        qty_to_sell = client.adjust_quantity(pair, balance, is_market_order=True)
+        if qty_to_sell > 0:
+            client.place_order(
+                symbol=pair,
+                side='SELL',
+                order_type='MARKET',
+                quantity=qty_to_sell
+            )
+            add_log(f"Swept dust: Sold {qty_to_sell} {asset_name}", "success")
+    except BinanceClientError as e:
+        add_log(f"Failed to sweep {asset_name}: {e}", "warning")
 
 
 @app.route('/api/reset_portfolio', methods=['POST'])
@@ -580,31 +1067,34 @@ def api_reset_portfolio():
     add_log("Starting Portfolio Reset...", "warning")
     
     try:
-        # 1. Cancel all open orders
+        # 1. Cancel all open orders: one bulk request per symbol, issued concurrently
         open_orders = client.get_open_orders()
         if open_orders:
-            for order in open_orders:
-                client.cancel_order(symbol=order['symbol'], order_id=order['orderId'])
+            list(_pool.map(client.cancel_open_orders, {o['symbol'] for o in open_orders}))
             add_log(f"Cancelled {len(open_orders)} open orders.", "success")
+            notify_orders_changed()
         else:
             add_log("No open orders to cancel.", "info")
         
         # 2. Analyze and sell assets
+        balances_future = _pool.submit(client.get_balances, non_zero_only=True)
         prices = client.get_all_prices()
-        balances = client.get_balances(non_zero_only=True)
+        balances = balances_future.result()
         
         sellable_assets = []
         dust_assets = []
         no_pair_assets = []
         
+        # Only pairs that are currently trading; a halted symbol still has a last price
+        usdt_pairs = client.get_quote_pairs('USDT')
         for b in balances:
             asset_name = b['asset']
             free_amt = float(b['free'])
             
             if asset_name != 'USDT' and free_amt > 0:
-                pair = f"{asset_name}USDT"
-                if pair in prices:
-                    price = prices[pair]
+                pair = usdt_pairs.get(asset_name)
+                price = prices.get(pair) if pair else None
+                if price is not None:
                     value = free_amt * price
                     if value >= 10.0:
                         sellable_assets.append((asset_name, free_amt, pair))
@@ -616,97 +1106,35 @@ def api_reset_portfolio():
         if no_pair_assets:
             add_log(f"Skipping {len(no_pair_assets)} assets without USDT pairs", "info")
         
-        # Sell sellable assets
-        for asset_name, free_amt, pair in sellable_assets:
-            try:
-                min_qty = client.get_min_market_lot_size(pair)
-                max_qty = client.get_max_market_lot_size(pair)
-                
-                remaining = free_amt
-                total_sold = 0.0
-                
-                while remaining > 0:
-                    qty_to_sell = client.adjust_quantity(pair, remaining, is_market_order=True)
-                    
-                    if qty_to_sell <= 0 or qty_to_sell < min_qty:
-                        if total_sold == 0:
-                            dust_assets.append((asset_name, remaining, pair))
-                        break
-                    
-                    result = client.place_order(
-                        symbol=pair,
-                        side='SELL',
-                        order_type='MARKET',
-                        quantity=qty_to_sell
-                    )
-                    
-                    status = result.get('status', '')
-                    executed_qty = float(result.get('executedQty', 0))
-                    
-                    if status == 'EXPIRED' or executed_qty == 0:
-                        add_log(f"Cannot sell {asset_name}: No liquidity on testnet.", "warning")
-                        break
-                    
-                    total_sold += executed_qty
-                    remaining -= executed_qty
-                    add_log(f"Sold {executed_qty} {asset_name}", "success")
-                    
-                    if remaining > 0 and remaining >= min_qty:
-                        time.sleep(0.3)
-                    else:
-                        break
-                        
-            except BinanceClientError as e:
-                add_log(f"Failed to sell {asset_name}: {e}", "error")
+        # Sell sellable assets, one worker per symbol
+        unsold = _pool.map(lambda a: _sell_asset(client, *a), sellable_assets)
+        dust_assets.extend(d for d in unsold if d is not None)
         
-        # Sweep dust assets
+        # Sweep dust assets: buy all top-ups together, settle once, then sell all together
         if dust_assets:
             add_log(f"Found {len(dust_assets)} dust assets. Attempting to sweep...", "info")
             
-            account = client.get_account_info()
-            usdt_balance = 0.0
-            for b in account['balances']:
-                if b['asset'] == 'USDT':
-                    usdt_balance = float(b['free'])
-                    break
+            account = fetch_account_info()
+            usdt = account['balances_by_asset'].get('USDT')
+            usdt_balance = float(usdt['free']) if usdt else 0.0
             
-            for asset_name, free_amt, pair in dust_assets:
-                if usdt_balance < 11.0:
-                    add_log(f"Skipping dust sweep: Insufficient USDT", "warning")
-                    break
+            affordable = int(usdt_balance // 11.0)
+            if affordable < len(dust_assets):
+                add_log(f"Skipping dust sweep for {len(dust_assets) - affordable} assets: Insufficient USDT", "warning")
+                dust_assets = dust_assets[:affordable]
+            
+            bought = _pool.map(lambda d: _buy_dust(client, d[0], d[2]), dust_assets)
+            to_sell = [d for d, ok in zip(dust_assets, list(bought)) if ok]
+            
+            if to_sell:
+                time.sleep(0.5)
+                
+                new_bals = fetch_account_info()['balances_by_asset']
                 
-                try:
-                    buy_result = client.place_order(
-                        symbol=pair,
-                        side='BUY',
-                        order_type='MARKET',
-                        quote_order_qty=11.0
-                    )
-                    
-                    if buy_result.get('status') == 'EXPIRED' or float(buy_result.get('executedQty', 0)) == 0:
-                        continue
-                    
-                    time.sleep(0.5)
-                    
-                    sub_acc = client.get_account_info()
-                    new_bal = 0.0
-                    for b in sub_acc['balances']:
-                        if b['asset'] == asset_name:
-                            new_bal = float(b['free'])
-                            break
-                    
-                    qty_to_sell = client.adjust_quantity(pair, new_bal, is_market_order=True)
-                    if qty_to_sell > 0:
-                        client.place_order(
-                            symbol=pair,
-                            side='SELL',
-                            order_type='MARKET',
-                            quantity=qty_to_sell
-                        )
-                        add_log(f"Swept dust: Sold {qty_to_sell} {asset_name}", "success")
-                        
-                except BinanceClientError as e:
-                    add_log(f"Failed to sweep {asset_name}: {e}", "warning")
+                list(_pool.map(
+                    lambda d: _sell_dust(client, d[0], d[2], float(new_bals[d[0]]['free']) if d[0] in new_bals else 0.0),
+                    to_sell
+                ))
         
         add_log("Portfolio Reset Complete.", "success")
         cache.clear()
@@ -714,7 +1142,7 @@ def api_reset_portfolio():
         
     except BinanceClientError as e:
         add_log(f"Error during reset: {e}", "error")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
 @app.route('/api/balance/<asset>')
@@ -724,17 +1152,25 @@ def api_get_balance(asset):
     if not account:
         return jsonify({'balance': 0.0})
     
-    for b in account.get('balances', []):
-        if b['asset'] == asset:
-            return jsonify({
-                'asset': asset,
-                'free': float(b['free']),
-                'locked': float(b['locked'])
-            })
+    b = account['balances_by_asset'].get(asset)
+    if b:
+        return jsonify({
+            'asset': asset,
+            'free': float(b['free']),
+            'locked': float(b['locked'])
+        })
     
     return jsonify({'asset': asset, 'free': 0.0, 'locked': 0.0})
 
 
+# Per-request cProfile dumps for finding route hotspots: FLASK_PROFILE=1 python app.py
+if os.environ.get('FLASK_PROFILE') == '1':
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    os.makedirs('profiles', exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30], profile_dir='profiles')
+
+
 if __name__ == "__main__":
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server; see README for running under gunicorn
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
 
@@ -1,3 +1,4 @@
 from .client import BinanceClient
+from .stream import BinanceStream
 
-__all__ = ['BinanceClient']
+__all__ = ['BinanceClient', 'BinanceStream']
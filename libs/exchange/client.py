@@ -4,20 +4,63 @@ Binance Exchange Client Module
 This module provides a wrapper around the Binance Spot API for testnet operations.
 """
 
-import json
+import functools
+import logging
+import threading
+import time
+from collections import deque
 from decimal import Decimal
+from enum import Enum
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from binance.spot import Spot
 from binance.error import ClientError, ServerError
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; portfolio valuation falls back to plain Python
+    np = None
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=4)
 def load_secrets(path: str = 'resources/secrets.json') -> dict:
-    """Load API secrets from JSON file."""
-    with open(path, 'r') as f:
-        return json.load(f)
+    """Load API secrets from JSON file, read once per path."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 class BinanceClient:
     BASE_URL = 'https://testnet.binance.vision'
+    # Below this many balances the NumPy setup cost outweighs the vectorized math
+    VECTORIZE_MIN_ASSETS = 50
+    # Keep-alive connections to the API host; sized for the app's worker pool plus request threads
+    POOL_SIZE = 16
+    # Filters change rarely; prices are re-fetched at most this often by repeated calls
+    EXCHANGE_INFO_TTL = 60 * 60
+    PRICES_TTL = 1.0
+    # After a failed refresh the stale copy is served for this long, doubling per failure
+    STALE_BACKOFF = 1.0
+    STALE_BACKOFF_MAX = 60.0
+    # Request weight budget per minute; replaced by the REQUEST_WEIGHT limit from exchange info
+    WEIGHT_LIMIT = 1200
+    # New orders allowed per ORDER_WINDOW seconds; replaced by the ORDERS limit from exchange info
+    ORDER_LIMIT = 50
+    ORDER_WINDOW = 10.0
+    # Request weights of the endpoints this client calls (Binance Spot API docs)
+    WEIGHTS = {
+        'account': 20,
+        'prices': 4,
+        'price': 2,
+        'exchange_info': 20,
+        'open_orders': 6,
+        'open_orders_all': 80,
+        'all_orders': 20,
+        'order': 1,
+        'listen_key': 2,
+    }
     
     def __init__(self, api_key: str = None, api_secret: str = None, secrets_path: str = 'resources/secrets.json'):
         if api_key is None or api_secret is None:
@@ -30,12 +73,128 @@ class BinanceClient:
             api_secret=api_secret, 
             base_url=self.BASE_URL
         )
+        # requests' default pool keeps 10 connections per host and drops the rest,
+        # so concurrent calls beyond that paid a fresh TLS handshake each time.
+        # Gateway errors on reads are retried. Signed writes are not: a cancel that
+        # succeeded behind a 502 would come back as "Unknown order". 429s are left to
+        # _track_weight's Retry-After back-off rather than retried here.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET'}),
+            raise_on_status=False
+        )
+        self._client.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=retry
+        ))
+        self._client.session.hooks['response'].extend((self._track_weight, self._use_orjson))
+        self._weight_lock = threading.Lock()
+        self._weight_limit = self.WEIGHT_LIMIT
+        self._used_weight = 0
+        self._weight_window = 0
+        self._blocked_until = 0.0
+        self._order_lock = threading.Lock()
+        self._order_window = self.ORDER_WINDOW
+        self._order_times = deque(maxlen=self.ORDER_LIMIT)
+        # (payload, monotonic fetch time)
         self._exchange_info_cache = None
+        self._prices_cache = None
+        self._symbol_filters = {}
+        self._lot_params = {}
+        self._sorted_symbols = ()
+        self._quote_pairs = {}
+        self._refresh_failures = {}
+        self._exchange_info_lock = threading.Lock()
+        
+        # Warm the filter index so the first order doesn't wait on exchange info
+        threading.Thread(target=self._prefetch_exchange_info, daemon=True).start()
+    
+
+    def _prefetch_exchange_info(self):
+        try:
+            self.get_exchange_info()
+        except BinanceClientError as e:
+            logger.warning("Exchange info prefetch failed: %s", e)
+    
+
+    # ========== Rate Limiting ==========
+    
+    def _track_weight(self, response, *args, **kwargs):
+        """Session hook: sync the used weight from Binance and note 429/418 back-off windows."""
+        used = response.headers.get('X-MBX-USED-WEIGHT-1M')
+        if used is not None:
+            with self._weight_lock:
+                self._used_weight = int(used)
+                self._weight_window = int(time.time() // 60)
+        
+        if response.status_code in (418, 429):
+            retry_after = response.headers.get('Retry-After')
+            with self._weight_lock:
+                self._blocked_until = time.time() + (int(retry_after) if retry_after else 60)
+    
+
+    @staticmethod
+    def _use_orjson(response, *args, **kwargs):
+        """Session hook: decode response bodies with orjson instead of the stdlib parser."""
+        # Raises orjson.JSONDecodeError, a ValueError, just like Response.json()
+        response.json = lambda **_: orjson.loads(response.content)
+    
+
+    def _reserve_weight(self, endpoint: str):
+        """Count the endpoint's weight against this minute's budget, failing fast if it would not fit."""
+        weight = self.WEIGHTS[endpoint]
+        now = time.time()
+        with self._weight_lock:
+            if now < self._blocked_until:
+                raise BinanceClientError(
+                    f"Rate limited by Binance, retry in {int(self._blocked_until - now) + 1}s"
+                )
+            
+            window = int(now // 60)
+            if window != self._weight_window:
+                self._weight_window = window
+                self._used_weight = 0
+            
+            if self._used_weight + weight > self._weight_limit:
+                # Binance resets the weight counter at the start of each minute
+                raise BinanceClientError(
+                    f"Request weight budget used up, retry in {int((window + 1) * 60 - now) + 1}s"
+                )
+            
+            self._used_weight += weight
+    
+
+    def _serve_stale(self, name: str, cached: tuple, ttl: float, error: 'BinanceClientError') -> tuple:
+        """Re-stamp a stale (payload, fetch time) entry so it is reused until the backoff elapses."""
+        failures = self._refresh_failures.get(name, 0) + 1
+        self._refresh_failures[name] = failures
+        backoff = min(self.STALE_BACKOFF * 2 ** (failures - 1), self.STALE_BACKOFF_MAX)
+        # Only the first failure of an outage is worth a warning; retries log at debug
+        log = logger.warning if failures == 1 else logger.debug
+        log("Serving stale %s for %.0fs: %s", name, backoff, error)
+        return cached[0], time.monotonic() - ttl + backoff
+    
+
+    def _throttle_orders(self):
+        """Wait only as long as needed for another order to fit in the ORDERS window."""
+        with self._order_lock:
+            sent = self._order_times
+            now = time.monotonic()
+            if len(sent) == sent.maxlen:
+                wait = self._order_window - (now - sent[0])
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.monotonic()
+            sent.append(now)
     
 
     # ========== Account Operations ==========
     
     def get_account_info(self) -> dict | None:
+        self._reserve_weight('account')
         try:
             return self._client.account()
         except ClientError as e:
@@ -49,16 +208,60 @@ class BinanceClient:
         if not account:
             return []
         
-        balances = account.get('balances', [])
         if non_zero_only:
-            balances = [b for b in balances if float(b['free']) > 0 or float(b['locked']) > 0]
+            return self.get_nonzero_assets(account)
         
-        return balances
+        return account.get('balances', [])
+    
+
+    @staticmethod
+    def get_balances_by_asset(account: dict) -> dict[str, dict]:
+        """Get balances keyed by asset, memoized on the account snapshot."""
+        index = account.get('balances_by_asset')
+        if index is None:
+            index = {b['asset']: b for b in account.get('balances', [])}
+            account['balances_by_asset'] = index
+        return index
+    
+
+    @staticmethod
+    def get_nonzero_assets(account: dict) -> list[dict]:
+        """Get non-zero balances with free/locked as floats, memoized on the account snapshot."""
+        assets = account.get('nonzero_assets')
+        if assets is None:
+            assets = []
+            for b in account.get('balances', []):
+                free = float(b['free'])
+                locked = float(b['locked'])
+                if free > 0 or locked > 0:
+                    assets.append({'asset': b['asset'], 'free': free, 'locked': locked})
+            account['nonzero_assets'] = assets
+        return assets
     
 
     # ========== Price Operations ==========
     
-    def get_all_prices(self) -> dict[str, float]:
+    def get_all_prices(self, use_cache: bool = True) -> dict[str, float]:
+        cached = self._prices_cache
+        if use_cache and cached and time.monotonic() - cached[1] < self.PRICES_TTL:
+            return cached[0]
+        
+        try:
+            prices = self._fetch_prices()
+        except BinanceClientError as e:
+            # Keep the dashboard usable through rate limits and outages
+            if cached is None:
+                raise
+            self._prices_cache = self._serve_stale('prices', cached, self.PRICES_TTL, e)
+            return cached[0]
+        
+        self._refresh_failures.pop('prices', None)
+        self._prices_cache = (prices, time.monotonic())
+        return prices
+    
+
+    def _fetch_prices(self) -> dict[str, float]:
+        self._reserve_weight('prices')
         try:
             ticker = self._client.ticker_price()
             return {t['symbol']: float(t['price']) for t in ticker}
@@ -69,18 +272,77 @@ class BinanceClient:
     
 
     def get_price(self, symbol: str) -> float:
-        prices = self.get_all_prices()
-        return prices.get(symbol, 0.0)
+        cached = self._prices_cache
+        if cached and time.monotonic() - cached[1] < self.PRICES_TTL:
+            return cached[0].get(symbol, 0.0)
+        
+        # Single-symbol ticker instead of downloading every price
+        self._reserve_weight('price')
+        try:
+            return float(self._client.ticker_price(symbol=symbol)['price'])
+        except ClientError as e:
+            if getattr(e, 'error_code', None) == -1121:  # Invalid symbol
+                return 0.0
+            raise BinanceClientError(f"Error fetching price: {e}")
+        except (ServerError, Exception) as e:
+            raise BinanceClientError(f"Error fetching price: {e}")
     
     # ========== Exchange Info ==========
     
     def get_exchange_info(self, use_cache: bool = True) -> dict:
-        if use_cache and self._exchange_info_cache:
-            return self._exchange_info_cache
+        cached = self._exchange_info_cache
+        if use_cache and cached and time.monotonic() - cached[1] < self.EXCHANGE_INFO_TTL:
+            return cached[0]
         
+        # One fetch at a time: callers arriving mid-fetch (e.g. during the startup
+        # prefetch) wait for it and reuse the result
+        with self._exchange_info_lock:
+            refreshed = self._exchange_info_cache
+            if refreshed is not cached:
+                return refreshed[0]
+            return self._refresh_exchange_info(cached)
+    
+
+    def _refresh_exchange_info(self, cached: tuple | None) -> dict:
         try:
-            self._exchange_info_cache = self._client.exchange_info()
-            return self._exchange_info_cache
+            info = self._fetch_exchange_info()
+        except BinanceClientError as e:
+            if cached is None:
+                raise
+            self._exchange_info_cache = self._serve_stale('exchange info', cached, self.EXCHANGE_INFO_TTL, e)
+            return cached[0]
+        self._refresh_failures.pop('exchange info', None)
+        
+        # Index filters by symbol once per fetch so lookups don't scan every symbol
+        symbol_filters = {
+            s['symbol']: {f['filterType']: f for f in s['filters']}
+            for s in info.get('symbols', [])
+        }
+        
+        for limit in info.get('rateLimits', []):
+            if (limit.get('rateLimitType') == 'REQUEST_WEIGHT'
+                    and limit.get('interval') == 'MINUTE' and limit.get('intervalNum') == 1):
+                self._weight_limit = limit['limit']
+            elif limit.get('rateLimitType') == 'ORDERS' and limit.get('interval') == 'SECOND':
+                with self._order_lock:
+                    if self._order_times.maxlen != limit['limit']:
+                        self._order_times = deque(self._order_times, maxlen=limit['limit'])
+                    self._order_window = float(limit.get('intervalNum', 1))
+        
+        self._symbol_filters = symbol_filters
+        self._lot_params = {}  # Filters may have changed; re-derive lot params lazily
+        self._quote_pairs = {}
+        self._sorted_symbols = tuple(sorted(
+            s['symbol'] for s in info.get('symbols', []) if s.get('status') == 'TRADING'
+        ))
+        self._exchange_info_cache = (info, time.monotonic())
+        return info
+    
+
+    def _fetch_exchange_info(self) -> dict:
+        self._reserve_weight('exchange_info')
+        try:
+            return self._client.exchange_info()
         except ClientError as e:
             raise BinanceClientError(f"Error fetching exchange info: {e}")
         except (ServerError, Exception) as e:
@@ -88,29 +350,53 @@ class BinanceClient:
     
 
     def get_symbol_filters(self, symbol: str) -> dict | None:
+        if not self.get_exchange_info():
+            return None
+        return self._symbol_filters.get(symbol)
+    
+
+    def get_quote_pairs(self, quote: str = 'USDT') -> dict[str, str]:
+        """Map base asset -> trading symbol for one quote asset, built once per exchange info fetch."""
         info = self.get_exchange_info()
-        if not info:
+        pairs = self._quote_pairs.get(quote)
+        if pairs is None:
+            pairs = {
+                s['baseAsset']: s['symbol'] for s in info.get('symbols', [])
+                if s.get('quoteAsset') == quote and s.get('status') == 'TRADING'
+            }
+            self._quote_pairs[quote] = pairs
+        return pairs
+    
+
+    @staticmethod
+    def _parse_step(step_size: str) -> tuple[int, int] | None:
+        """Split a stepSize string into (step in units of its last decimal, 10 ** decimals)."""
+        step = Decimal(step_size).normalize()
+        if step <= 0:
             return None
-        
-        for s in info.get('symbols', []):
-            if s['symbol'] == symbol:
-                return {f['filterType']: f for f in s['filters']}
-        
-        return None
+        exponent = step.as_tuple().exponent
+        scale = 10 ** -exponent if exponent < 0 else 1
+        return int(step * scale), scale
     
 
-    def adjust_quantity(self, symbol: str, quantity: float, is_market_order: bool = False) -> float:
-        filters = self.get_symbol_filters(symbol)
+    def _get_lot_params(self, symbol: str, is_market_order: bool) -> tuple | None:
+        """Get (parsed step, min_qty, max_qty) for a symbol, parsed once per exchange info fetch."""
+        filters = self.get_symbol_filters(symbol)  # Also refreshes exchange info when the TTL expires
         if not filters:
-            return quantity
+            return None
+        
+        key = (symbol, is_market_order)
+        params = self._lot_params.get(key)
+        if params is not None:
+            return params
         
         # For market orders, we need to respect BOTH:
         # - LOT_SIZE for step size (always applies)
         # - MARKET_LOT_SIZE for min/max (if available)
         
-        # Get step size from LOT_SIZE (always required)
+        # Step size comes from LOT_SIZE (always required)
         lot_filter = filters.get('LOT_SIZE', {})
-        step_size = float(lot_filter.get('stepSize', 0))
+        step = self._parse_step(lot_filter.get('stepSize', '0'))
         
         # Get min/max from appropriate filter
         if is_market_order and 'MARKET_LOT_SIZE' in filters:
@@ -124,29 +410,36 @@ class BinanceClient:
             min_qty = float(lot_filter.get('minQty', 0))
             max_qty = float(lot_filter.get('maxQty', float('inf')))
         
+        params = (step, min_qty, max_qty)
+        self._lot_params[key] = params
+        return params
+    
+
+    def adjust_quantity(self, symbol: str, quantity: float, is_market_order: bool = False) -> float:
+        params = self._get_lot_params(symbol, is_market_order)
+        if params is None:
+            return quantity
+        step, min_qty, max_qty = params
+        
         result = quantity
         
         # First clamp to max (before step adjustment to avoid precision issues)
         if max_qty > 0 and result > max_qty:
             result = max_qty
         
-        # Apply step size adjustment if step_size > 0
-        if step_size > 0:
-            # Use Decimal for precision
-            q = Decimal(str(result))
-            s = Decimal(str(step_size))
+        # Apply step size adjustment if the symbol has a step size
+        if step:
+            step_int, scale = step
             
-            # Floor division to nearest step
-            adjusted_q = (q // s) * s
-            
-            # Determine precision from step_size
-            s_str = f"{step_size:.8f}".rstrip('0')
-            if '.' in s_str:
-                precision = len(s_str.split('.')[1])
-            else:
-                precision = 0
+            # Floor to whole units of the step's last decimal using the float's exact ratio
+            n, d = result.as_integer_ratio()
+            whole = n * scale // d
+            # The float may sit just below the decimal it was written as (0.3 -> 0.2999...)
+            if (whole + 1) / scale == result:
+                whole += 1
             
-            result = float(f"{adjusted_q:.{precision}f}")
+            # Floor division to nearest step
+            result = (whole // step_int) * step_int / scale
         
         # Check min after step adjustment
         if result < min_qty:
@@ -157,40 +450,24 @@ class BinanceClient:
 
     def get_min_market_lot_size(self, symbol: str) -> float:
         """Get the minimum quantity for market orders."""
-        filters = self.get_symbol_filters(symbol)
-        if not filters:
+        params = self._get_lot_params(symbol, True)
+        if params is None:
             return 0.0
-        
-        if 'MARKET_LOT_SIZE' in filters:
-            return float(filters['MARKET_LOT_SIZE'].get('minQty', 0))
-        elif 'LOT_SIZE' in filters:
-            return float(filters['LOT_SIZE'].get('minQty', 0))
-        
-        return 0.0
+        return params[1]
     
 
     def get_max_market_lot_size(self, symbol: str) -> float:
         """Get the maximum quantity for market orders."""
-        filters = self.get_symbol_filters(symbol)
-        if not filters:
+        params = self._get_lot_params(symbol, True)
+        if params is None or params[2] <= 0:
             return float('inf')
-        
-        if 'MARKET_LOT_SIZE' in filters:
-            max_qty = float(filters['MARKET_LOT_SIZE'].get('maxQty', 0))
-            if max_qty > 0:
-                return max_qty
-        
-        if 'LOT_SIZE' in filters:
-            max_qty = float(filters['LOT_SIZE'].get('maxQty', 0))
-            if max_qty > 0:
-                return max_qty
-        
-        return float('inf')
+        return params[2]
     
 
     # ========== Order Operations ==========
     
     def get_open_orders(self, symbol: str = None) -> list[dict]:
+        self._reserve_weight('open_orders' if symbol else 'open_orders_all')
         try:
             return self._client.get_open_orders(symbol=symbol)
         except ClientError as e:
@@ -200,6 +477,7 @@ class BinanceClient:
     
 
     def get_all_orders(self, symbol: str) -> list[dict]:
+        self._reserve_weight('all_orders')
         try:
             return self._client.get_orders(symbol=symbol)
         except ClientError as e:
@@ -226,6 +504,8 @@ class BinanceClient:
             params["timeInForce"] = time_in_force
             params["price"] = price
         
+        self._reserve_weight('order')
+        self._throttle_orders()
         try:
             return self._client.new_order(**params)
         except ClientError as e:
@@ -233,20 +513,56 @@ class BinanceClient:
     
 
     def cancel_order(self, symbol: str, order_id: str) -> dict:
+        self._reserve_weight('order')
         try:
             return self._client.cancel_order(symbol=symbol, orderId=order_id)
         except ClientError as e:
             raise BinanceClientError(f"Cancel failed: {e}")
     
 
+    def cancel_open_orders(self, symbol: str) -> list[dict]:
+        """Cancel every open order on a symbol in one request."""
+        self._reserve_weight('order')
+        try:
+            return self._client.cancel_open_orders(symbol=symbol)
+        except ClientError as e:
+            raise BinanceClientError(f"Cancel failed: {e}")
+    
+
+    # ========== User Data Stream ==========
+    
+    def create_listen_key(self) -> str:
+        self._reserve_weight('listen_key')
+        try:
+            return self._client.new_listen_key()['listenKey']
+        except ClientError as e:
+            raise BinanceClientError(f"Error creating listen key: {e}")
+        except (ServerError, Exception) as e:
+            raise BinanceClientError(f"Error creating listen key: {e}")
+    
+
+    def renew_listen_key(self, listen_key: str) -> None:
+        self._reserve_weight('listen_key')
+        try:
+            self._client.renew_listen_key(listen_key)
+        except ClientError as e:
+            raise BinanceClientError(f"Error renewing listen key: {e}")
+        except (ServerError, Exception) as e:
+            raise BinanceClientError(f"Error renewing listen key: {e}")
+    
+
     # ========== Utility Methods ==========
     
-    def get_all_symbols(self) -> list[str]:
-        prices = self.get_all_prices()
-        return sorted(list(prices.keys()))
+    def get_all_symbols(self) -> tuple[str, ...]:
+        """Get the sorted trading symbols, rebuilt only when exchange info is re-fetched."""
+        self.get_exchange_info()
+        return self._sorted_symbols
     
 
     def calculate_portfolio_value(self, balances: list[dict], prices: dict[str, float]) -> tuple[float, float, list[dict]]:
+        if np is not None and len(balances) >= self.VECTORIZE_MIN_ASSETS:
+            return self.calculate_portfolio_value_np(balances, prices)
+        
         usdt_balance = 0.0
         portfolio_value = 0.0
         asset_data = []
@@ -275,14 +591,73 @@ class BinanceClient:
             })
         
         return usdt_balance, portfolio_value, asset_data
+    
+
+    @staticmethod
+    def calculate_portfolio_value_np(balances: list[dict], prices: dict[str, float]) -> tuple[float, float, list[dict]]:
+        """Vectorized calculate_portfolio_value using NumPy column arrays."""
+        count = len(balances)
+        symbols = [b['asset'] for b in balances]
+        free = np.fromiter((float(b['free']) for b in balances), dtype=np.float64, count=count)
+        locked = np.fromiter((float(b['locked']) for b in balances), dtype=np.float64, count=count)
+        price = np.fromiter(
+            (1.0 if s == 'USDT' else prices.get(f"{s}USDT", 0.0) for s in symbols),
+            dtype=np.float64, count=count
+        )
+        
+        total = free + locked
+        value = total * price
+        
+        usdt_balance = 0.0
+        if 'USDT' in symbols:
+            usdt_balance = float(total[symbols.index('USDT')])
+        
+        asset_data = [
+            {"Asset": s, "Free": f, "Locked": l, "Total": t, "Value (USDT)": v}
+            for s, f, l, t, v in zip(symbols, free.tolist(), locked.tolist(), total.tolist(), value.tolist())
+        ]
+        
+        return usdt_balance, float(value.sum()), asset_data
+
 
 
+class ErrorKind(Enum):
+    OTHER = 'other'
+    NOTIONAL = 'notional'
+    LOT_SIZE = 'lot_size'
+    MARKET_LOT_SIZE = 'market_lot_size'
+    LIQUIDITY = 'liquidity'
+    INSUFFICIENT_BALANCE = 'insufficient_balance'
+
 
 class BinanceClientError(Exception):
     def __init__(self, message: str, error_code: int = None, error_message: str = None):
         super().__init__(message)
         self.error_code = error_code
         self.error_message = error_message
+        self.kind = self._classify(error_code, error_message)
+    
+
+    @staticmethod
+    def _classify(error_code: int | None, error_message: str | None) -> ErrorKind:
+        """Scan the exchange message once so the is_* checks are plain comparisons."""
+        if not error_message:
+            return ErrorKind.OTHER
+        if error_code == -1013:
+            # MARKET_LOT_SIZE also contains LOT_SIZE, so test it first
+            if "MARKET_LOT_SIZE" in error_message:
+                return ErrorKind.MARKET_LOT_SIZE
+            if "LOT_SIZE" in error_message:
+                return ErrorKind.LOT_SIZE
+            if "NOTIONAL" in error_message:
+                return ErrorKind.NOTIONAL
+        elif error_code == -2010:
+            message = error_message.lower()
+            if "liquidity" in message:
+                return ErrorKind.LIQUIDITY
+            if "insufficient balance" in message:
+                return ErrorKind.INSUFFICIENT_BALANCE
+        return ErrorKind.OTHER
     
 
     @classmethod
@@ -305,20 +680,21 @@ class BinanceClientError(Exception):
         return msg
 
     def is_notional_error(self) -> bool:
-        return self.error_code == -1013 and self.error_message and "NOTIONAL" in self.error_message
+        return self.kind is ErrorKind.NOTIONAL
     
     
     def is_lot_size_error(self) -> bool:
-        return self.error_code == -1013 and self.error_message and "LOT_SIZE" in self.error_message
+        # A MARKET_LOT_SIZE failure is also a LOT_SIZE failure
+        return self.kind is ErrorKind.LOT_SIZE or self.kind is ErrorKind.MARKET_LOT_SIZE
     
     
     def is_market_lot_size_error(self) -> bool:
-        return self.error_code == -1013 and self.error_message and "MARKET_LOT_SIZE" in self.error_message
+        return self.kind is ErrorKind.MARKET_LOT_SIZE
     
     
     def is_liquidity_error(self) -> bool:
-        return self.error_code == -2010 and self.error_message and "liquidity" in self.error_message.lower()
+        return self.kind is ErrorKind.LIQUIDITY
     
     
     def is_insufficient_balance(self) -> bool:
-        return self.error_code == -2010 and self.error_message and "insufficient balance" in self.error_message.lower()
+        return self.kind is ErrorKind.INSUFFICIENT_BALANCE
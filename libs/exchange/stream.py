@@ -0,0 +1,243 @@
+"""
+Binance Stream Module
+
+This module keeps an in-memory snapshot of prices and account balances up to date
+from the Binance Spot Testnet websocket streams, so callers can read state without
+issuing REST requests.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+import orjson
+from binance.websocket.spot.websocket_stream import SpotWebsocketStreamClient
+
+from .client import BinanceClient, BinanceClientError
+
+logger = logging.getLogger(__name__)
+
+
+class BinanceStream:
+    STREAM_URL = 'wss://stream.testnet.binance.vision'
+    LISTEN_KEY_KEEPALIVE = 30 * 60
+    RECONNECT_DELAY = 10
+    # The ticker stream pushes every second; silence this long means the socket has stalled
+    STALE_AFTER = 15
+    # How long a closing socket gets to finish its handshake before it is torn down
+    CLOSE_TIMEOUT = 5
+    
+    def __init__(self, client: BinanceClient, on_execution: Optional[Callable[[dict], None]] = None):
+        self._client = client
+        self._on_execution = on_execution
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._prices = {}
+        self._account = None
+        self._balances = {}
+        # Position updates received while the REST account snapshot is in flight
+        self._pending = None
+        self._ws = None
+        self._listen_key = None
+        self._keepalive_timer = None
+        self._connected = False
+        self._last_attempt = 0.0
+        self._last_message = 0.0
+    
+
+    # ========== Connection Management ==========
+    
+    def ensure_running(self) -> bool:
+        """Report whether the stream is live, reconnecting it in the background if it is not connected or has stalled."""
+        if self._is_live():
+            return True
+        
+        now = time.monotonic()
+        if now - self._last_attempt < self.RECONNECT_DELAY:
+            return False
+        if not self._start_lock.acquire(blocking=False):
+            return False  # Another thread is already connecting
+        
+        # Connect off the request path; callers fall back to REST until the stream is live
+        self._last_attempt = now
+        threading.Thread(target=self._reconnect, daemon=True).start()
+        return False
+    
+
+    def _reconnect(self):
+        try:
+            self.stop()
+            self._start()
+        except Exception as e:
+            logger.warning("Error starting websocket stream: %s", e)
+            self.stop()
+        finally:
+            self._start_lock.release()
+    
+
+    def _start(self):
+        listen_key = None
+        try:
+            listen_key = self._client.create_listen_key()
+        except BinanceClientError as e:
+            # Prices can still be streamed; account data falls back to REST
+            logger.warning("User data stream unavailable: %s", e)
+        
+        with self._lock:
+            self._prices = {}
+            self._pending = []
+        
+        self._ws = SpotWebsocketStreamClient(
+            stream_url=self.STREAM_URL,
+            on_message=self._on_message,
+            on_close=self._on_disconnect,
+            on_error=self._on_disconnect,
+            is_combined=True
+        )
+        self._ws.ticker()
+        
+        if listen_key:
+            self._listen_key = listen_key
+            self._ws.user_data(listen_key)
+            self._schedule_keepalive()
+        
+        # Seed the snapshots over REST only once subscribed, so no update falls in between;
+        # the ticker stream only pushes symbols that changed
+        prices = self._client.get_all_prices()
+        account = self._client.get_account_info() if listen_key else None
+        
+        with self._lock:
+            # Prices already pushed by the stream are newer than the REST snapshot
+            self._prices = {**prices, **self._prices}
+            if account is not None:
+                self._set_account(account)
+                for event in self._pending:
+                    if event.get('u', 0) >= account.get('updateTime', 0):
+                        self._apply_balances(event)
+            self._pending = None
+        
+        self._last_message = time.monotonic()
+        self._connected = True
+    
+
+    def _is_live(self) -> bool:
+        return self._connected and time.monotonic() - self._last_message < self.STALE_AFTER
+    
+
+    def stop(self):
+        self._connected = False
+        if self._keepalive_timer is not None:
+            self._keepalive_timer.cancel()
+            self._keepalive_timer = None
+        if self._ws is not None:
+            # Close on its own thread: a half-dead socket can block the close handshake
+            threading.Thread(target=self._close_socket, args=(self._ws.socket_manager,), daemon=True).start()
+            self._ws = None
+        self._listen_key = None
+        with self._lock:
+            self._pending = None
+            self._set_account(None)
+    
+
+    def _close_socket(self, manager):
+        try:
+            manager.close()
+            manager.join(self.CLOSE_TIMEOUT)
+            if manager.is_alive():
+                manager.ws.shutdown()
+        except Exception:
+            pass
+    
+
+    def _on_disconnect(self, manager, *args):
+        if self._ws is None or manager is not self._ws.socket_manager:
+            return  # A replaced socket finishing its close
+        self._connected = False
+        with self._lock:
+            self._set_account(None)
+    
+
+    def _schedule_keepalive(self):
+        self._keepalive_timer = threading.Timer(self.LISTEN_KEY_KEEPALIVE, self._keepalive)
+        self._keepalive_timer.daemon = True
+        self._keepalive_timer.start()
+    
+
+    def _keepalive(self):
+        if not self._connected or not self._listen_key:
+            return
+        try:
+            self._client.renew_listen_key(self._listen_key)
+        except BinanceClientError as e:
+            logger.warning("Error renewing listen key: %s", e)
+        self._schedule_keepalive()
+    
+
+    # ========== Snapshots ==========
+    
+    def get_prices(self) -> dict[str, float] | None:
+        """Get a copy of the streamed prices, or None if the stream is not live."""
+        if not self._is_live():
+            return None
+        with self._lock:
+            return dict(self._prices)
+    
+
+    def get_account_info(self) -> dict | None:
+        """Get the streamed account snapshot, or None if the user stream is not live."""
+        if not self._is_live():
+            return None
+        with self._lock:
+            if self._account is None:
+                return None
+            return {
+                **self._account,
+                'balances': list(self._balances.values()),
+                'balances_by_asset': dict(self._balances)
+            }
+    
+
+    def _set_account(self, account: dict | None):
+        self._account = account
+        if account is None:
+            self._balances = {}
+        else:
+            self._balances = {b['asset']: b for b in account.get('balances', [])}
+    
+
+    # ========== Message Handling ==========
+    
+    def _on_message(self, _, message: str):
+        self._last_message = time.monotonic()
+        msg = orjson.loads(message)
+        data = msg.get('data')
+        if data is None:
+            return  # Subscription acknowledgements
+        
+        if isinstance(data, list):
+            self._apply_tickers(data)
+        elif data.get('e') == 'outboundAccountPosition':
+            self._apply_account_position(data)
+        elif data.get('e') == 'executionReport' and self._on_execution:
+            self._on_execution(data)
+    
+
+    def _apply_tickers(self, tickers: list[dict]):
+        with self._lock:
+            for t in tickers:
+                self._prices[t['s']] = float(t['c'])
+    
+
+    def _apply_account_position(self, event: dict):
+        with self._lock:
+            if self._account is None:
+                if self._pending is not None:
+                    self._pending.append(event)  # Replayed once the REST snapshot lands
+                return
+            self._apply_balances(event)
+    
+
+    def _apply_balances(self, event: dict):
+        for b in event.get('B', []):
+            # Replace rather than mutate so readers holding a copy stay consistent
+            self._balances[b['a']] = {'asset': b['a'], 'free': b['f'], 'locked': b['l']}
@@ -5,12 +5,69 @@ This module contains all the UI component definitions for the Binance Spot Testn
 It focuses purely on layout and display, with handlers provided separately.
 """
 
+import functools
+import heapq
+import html
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
+from libs.exchange import BinanceClient
+
+
+# Swap thousands and decimal separators in a single pass
+_SWAP = str.maketrans({',': '.', '.': ','})
+
+# Fragment-scoped reruns need Streamlit 1.37+; older versions rerun the whole script
+_HAS_FRAGMENT = hasattr(st, 'fragment')
+_fragment = st.fragment if _HAS_FRAGMENT else (lambda func: func)
+
+# Activity log entry colors by level (text, background)
+_LOG_COLORS = {
+    'success': ('#0f5132', '#d1e7dd'),
+    'error': ('#842029', '#f8d7da'),
+    'warning': ('#664d03', '#fff3cd'),
+    'info': ('#055160', '#cff4fc'),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_nonzero(value: float) -> str:
+    return f"{value:,.2f}".translate(_SWAP)
+
+
+def _symbol_set(all_symbols: list[str]) -> frozenset[str]:
+    """Symbol set for O(1) membership checks, rebuilt only when the symbol list changes."""
+    # Matched by identity: the caller passes the same cached list across reruns,
+    # so no per-call tuple has to be built and hashed to find the memo
+    cached = st.session_state.get('_symbol_set')
+    if cached is None or cached[0] is not all_symbols:
+        cached = (all_symbols, frozenset(all_symbols))
+        st.session_state['_symbol_set'] = cached
+    return cached[1]
+
+
+def _filter_symbols(all_symbols: list[str], quotes: tuple[str, ...]) -> list[str]:
+    """Symbols ending in any of the quote assets, memoized per symbol list and quote selection."""
+    cached = st.session_state.get('_filtered_symbols')
+    if cached is None or cached[0] is not all_symbols or cached[1] != quotes:
+        cached = (all_symbols, quotes, [s for s in all_symbols if s.endswith(quotes)])
+        st.session_state['_filtered_symbols'] = cached
+    return cached[2]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_order_history(symbols: tuple[str, ...], _get_all_orders_func: Callable) -> list[dict]:
+    """Fetch order history for several symbols concurrently, cached across reruns."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(_get_all_orders_func, symbols))
+    return [order for orders in results if orders for order in orders]
 
 
 class GUIComponents:
+    # Most recent orders shown in the order history table
+    HISTORY_LIMIT = 200
+    
     def __init__(self, handlers):
         self.handlers = handlers
         self._log_placeholder = None
@@ -20,9 +77,10 @@ class GUIComponents:
     
     @staticmethod
     def format_number(value: float) -> str:
-        if value is None:
+        # Zero is handled up front: 0.0 and -0.0 would share one cache entry
+        if not value:
             return "0,00"
-        return f"{value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        return _format_nonzero(value)
     
 
     # ========== Page Setup ==========
@@ -57,19 +115,19 @@ class GUIComponents:
         # Filter option for small value assets
         hide_small = st.checkbox("Hide assets < 10 USDT", value=False, key="hide_small_assets")
         
-        df_assets = pd.DataFrame(asset_data)
-        
-        # Apply filter if checkbox is checked
+        # Apply filter if checkbox is checked, before the frame is built
         if hide_small:
-            df_assets = df_assets[df_assets["Value (USDT)"] >= 10.0]
-            if df_assets.empty:
+            asset_data = [a for a in asset_data if a["Value (USDT)"] >= 10.0]
+            if not asset_data:
                 st.info("No assets with value >= 10 USDT found.")
                 return None
         
-        # Format columns for display
-        df_display = df_assets.copy()
-        for col in ["Free", "Locked", "Total", "Value (USDT)"]:
-            df_display[col] = df_display[col].apply(self.format_number)
+        df_assets = pd.DataFrame(asset_data)
+        
+        # Format columns at render time instead of copying the frame into strings
+        df_display = df_assets.style.format(
+            self.format_number, subset=["Free", "Locked", "Total", "Value (USDT)"]
+        )
         
         event = st.dataframe(
             df_display, 
@@ -81,7 +139,7 @@ class GUIComponents:
         if event.selection.rows:
             selected_index = event.selection.rows[0]
             selected_asset = df_assets.iloc[selected_index]["Asset"]
-            self.handlers.handle_asset_selection(selected_asset, all_symbols)
+            self.handlers.handle_asset_selection(selected_asset, _symbol_set(all_symbols))
         
         return None
     
@@ -102,7 +160,7 @@ class GUIComponents:
         
         filtered_symbols = all_symbols
         if selected_quotes:
-            filtered_symbols = [s for s in all_symbols if any(s.endswith(q) for q in selected_quotes)]
+            filtered_symbols = _filter_symbols(all_symbols, tuple(selected_quotes))
         
         if not filtered_symbols:
             filtered_symbols = all_symbols
@@ -131,6 +189,8 @@ class GUIComponents:
         return symbol_input, current_price
     
 
+    # Fragments: switching order type or pressing Max reruns only the form, not the page
+    @_fragment
     def render_buy_form(self, symbol: str, current_price: float):
         st.write("Buy " + symbol)
         buy_type = st.radio("Order Type", ["LIMIT", "MARKET"], key="buy_type")
@@ -173,6 +233,7 @@ class GUIComponents:
                 st.rerun()
     
 
+    @_fragment
     def render_sell_form(self, symbol: str, current_price: float, account: dict):
         st.write("Sell " + symbol)
         
@@ -181,13 +242,14 @@ class GUIComponents:
         available_balance = 0.0
         
         if account:
-            candidates = [b['asset'] for b in account['balances'] if symbol.startswith(b['asset'])]
-            if candidates:
-                base_asset = sorted(candidates, key=len, reverse=True)[0]
-                for b in account['balances']:
-                    if b['asset'] == base_asset:
-                        available_balance = float(b['free'])
-                        break
+            # Longest asset the symbol starts with: probe the symbol's prefixes, longest first
+            balances = BinanceClient.get_balances_by_asset(account)
+            for end in range(len(symbol), 0, -1):
+                balance = balances.get(symbol[:end])
+                if balance is not None:
+                    base_asset = symbol[:end]
+                    available_balance = float(balance['free'])
+                    break
         
         if base_asset:
             col_bal, col_btn = st.columns([3, 1])
@@ -196,7 +258,10 @@ class GUIComponents:
             with col_btn:
                 if st.button("Max", key="btn_max_sell"):
                     st.session_state.sell_qty = available_balance
-                    st.rerun()
+                    if _HAS_FRAGMENT:
+                        st.rerun(scope="fragment")
+                    else:
+                        st.rerun()
         
         sell_type = st.radio("Order Type", ["LIMIT", "MARKET"], key="sell_type")
         
@@ -252,10 +317,11 @@ class GUIComponents:
             st.write("No open orders.")
             return
         
-        df_open = pd.DataFrame(open_orders)
         cols = ['symbol', 'orderId', 'price', 'origQty', 'executedQty', 'side', 'type', 'time']
-        cols = [c for c in cols if c in df_open.columns]
-        st.dataframe(df_open[cols])
+        cols = [c for c in cols if c in open_orders[0]]
+        # Only the displayed fields are materialized, not all ~20 per order
+        df_open = pd.DataFrame.from_records(open_orders, columns=cols)
+        st.dataframe(df_open)
         
         # Cancel Order
         cancel_id = st.text_input("Order ID to Cancel")
@@ -277,31 +343,31 @@ class GUIComponents:
         
         if st.checkbox("Show history for all active assets (May be slow)"):
             if assets:
+                symbol_set = _symbol_set(all_symbols)
                 for asset in assets:
                     s = asset['asset']
                     pair = f"{s}USDT"
-                    if pair in all_symbols:
+                    if pair in symbol_set:
                         history_symbols.add(pair)
         
-        all_history = []
         if len(history_symbols) > 3:
             st.caption(f"Fetching history for {len(history_symbols)} symbols...")
         
-        for sym in history_symbols:
-            orders = get_all_orders_func(sym)
-            if orders:
-                all_history.extend(orders)
+        all_history = _fetch_order_history(tuple(sorted(history_symbols)), get_all_orders_func)
         
         if all_history:
-            df_hist = pd.DataFrame(all_history)
+            # Newest first; partial selection instead of sorting the full history
+            recent = heapq.nlargest(self.HISTORY_LIMIT, all_history, key=lambda o: o.get('time', 0))
             cols = ['symbol', 'orderId', 'price', 'origQty', 'executedQty', 'side', 'type', 'status', 'time']
-            cols = [c for c in cols if c in df_hist.columns]
+            cols = [c for c in cols if c in recent[0]]
+            # Only the displayed fields are materialized, not all ~20 per order
+            df_hist = pd.DataFrame.from_records(recent, columns=cols)
             
             # Convert timestamp to human-readable format
             if 'time' in df_hist.columns:
                 df_hist['time'] = pd.to_datetime(df_hist['time'], unit='ms').dt.strftime('%Y-%m-%d %H:%M:%S')
             
-            st.dataframe(df_hist[cols].sort_values(by='time', ascending=False))
+            st.dataframe(df_hist)
         else:
             st.write("No order history found.")
     
@@ -350,17 +416,15 @@ class GUIComponents:
         if self._log_placeholder is None:
             return
         
-        if "activity_log" not in st.session_state:
-            st.session_state.activity_log = []
-        
-        with self._log_placeholder.container():
-            for log in st.session_state.activity_log:
-                msg = f"[{log['time']}] {log['msg']}"
-                if log['level'] == 'success':
-                    st.success(msg)
-                elif log['level'] == 'error':
-                    st.error(msg)
-                elif log['level'] == 'warning':
-                    st.warning(msg)
-                else:
-                    st.info(msg)
+        log = st.session_state.get("activity_log", ())
+        
+        # One markdown block instead of a widget per entry
+        entries = []
+        for entry in log:
+            color, background = _LOG_COLORS.get(entry['level'], _LOG_COLORS['info'])
+            entries.append(
+                f'<div style="color:{color};background:{background};padding:0.4rem 0.6rem;'
+                f'margin-bottom:0.3rem;border-radius:0.3rem">'
+                f"[{entry['time']}] {html.escape(entry['msg'])}</div>"
+            )
+        self._log_placeholder.markdown("".join(entries), unsafe_allow_html=True)
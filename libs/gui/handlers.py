@@ -6,12 +6,20 @@ These are separated from the GUI components to allow for clear separation of con
 """
 
 import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Collection
 import streamlit as st
 from libs.exchange import BinanceClient
 from libs.exchange.client import BinanceClientError
 
 
 class GUIHandlers:
+    # Concurrent API calls during bulk operations such as the portfolio reset
+    MAX_WORKERS = 8
+    # Entries kept in the activity log; older ones drop off the end
+    LOG_SIZE = 200
+    
     def __init__(self, client: BinanceClient):
         self.client = client
     
@@ -20,14 +28,21 @@ class GUIHandlers:
     
     @staticmethod
     def add_log(message: str, level: str = "info"):
+        GUIHandlers.add_logs([(message, level)])
+    
+
+    @staticmethod
+    def add_logs(entries: list[tuple[str, str]]):
+        """Append several (message, level) entries, oldest first, in one session state update."""
+        if not entries:
+            return
         if "activity_log" not in st.session_state:
-            st.session_state.activity_log = []
+            st.session_state.activity_log = deque(maxlen=GUIHandlers.LOG_SIZE)
         
-        st.session_state.activity_log.insert(0, {
-            "msg": message, 
-            "level": level, 
-            "time": time.strftime("%H:%M:%S")
-        })
+        now = time.strftime("%H:%M:%S")
+        st.session_state.activity_log.extendleft(
+            {"msg": message, "level": level, "time": now} for message, level in entries
+        )
     
 
     # ========== Data Refresh ==========
@@ -43,6 +58,13 @@ class GUIHandlers:
     
     def handle_buy_order(self, symbol: str, order_type: str, quantity: float, 
                          total_usdt: float, price: float) -> bool:
+        # Reject orders that can't pass the NOTIONAL filter before any API call;
+        # the price input holds the current price for market orders
+        estimated_value = quantity * price if quantity > 0 else total_usdt
+        if 0 < estimated_value < 10.0:
+            self.add_log(f"Buy Failed: Order value {estimated_value:.2f} USDT is too small (min ~10 USDT).", "error")
+            return False
+        
         try:
             qty_to_log = 0
             
@@ -156,13 +178,25 @@ class GUIHandlers:
         self.add_log("Starting Portfolio Reset...", "warning")
         
         try:
-            # 1. Cancel all open orders
+            # 1. Cancel all open orders: one bulk request per symbol, issued concurrently
             update_status("Cancelling open orders...")
             open_orders = self.client.get_open_orders()
             if open_orders:
-                for order in open_orders:
-                    self.client.cancel_order(symbol=order['symbol'], order_id=order['orderId'])
-                self.add_log(f"Cancelled {len(open_orders)} open orders.", "success")
+                orders_per_symbol = Counter(o['symbol'] for o in open_orders)
+                with ThreadPoolExecutor(max_workers=min(len(orders_per_symbol), self.MAX_WORKERS)) as pool:
+                    futures = {
+                        pool.submit(self.client.cancel_open_orders, symbol): symbol
+                        for symbol in orders_per_symbol
+                    }
+                    # One failed symbol shouldn't abort the reset
+                    failed = sum(
+                        orders_per_symbol[futures[f]]
+                        for f in as_completed(futures) if f.exception() is not None
+                    )
+                
+                self.add_log(f"Cancelled {len(open_orders) - failed} open orders.", "success")
+                if failed:
+                    self.add_log(f"Failed to cancel {failed} open orders.", "warning")
             else:
                 self.add_log("No open orders to cancel.", "info")
             
@@ -175,22 +209,25 @@ class GUIHandlers:
             dust_assets = []
             no_pair_assets = []
             
+            prices_get = prices.get
+            usdt_pairs = self.client.get_quote_pairs('USDT')
             for b in balances:
                 asset_name = b['asset']
+                if asset_name == 'USDT':
+                    continue
                 free_amt = float(b['free'])
+                if free_amt <= 0:
+                    continue
                 
-                if asset_name != 'USDT' and free_amt > 0:
-                    pair = f"{asset_name}USDT"
-                    if pair in prices:
-                        price = prices[pair]
-                        value = free_amt * price
-                        if value >= 10.0:
-                            sellable_assets.append((asset_name, free_amt, pair))
-                        else:
-                            dust_assets.append((asset_name, free_amt, pair))
-                    else:
-                        # No USDT trading pair available
-                        no_pair_assets.append(asset_name)
+                pair = usdt_pairs.get(asset_name)
+                price = prices_get(pair) if pair else None
+                if price is None:
+                    # No USDT trading pair available
+                    no_pair_assets.append(asset_name)
+                elif free_amt * price >= 10.0:
+                    sellable_assets.append((asset_name, free_amt, pair))
+                else:
+                    dust_assets.append((asset_name, free_amt, pair))
             
             # Log assets without trading pairs
             if no_pair_assets:
@@ -200,24 +237,33 @@ class GUIHandlers:
             if sellable_assets:
                 update_status(f"Selling {len(sellable_assets)} major assets...")
                 for asset_name, free_amt, pair in sellable_assets:
+                    # Buffer this asset's log lines and write them to session state once
+                    asset_logs = []
                     try:
                         min_qty = self.client.get_min_market_lot_size(pair)
                         max_qty = self.client.get_max_market_lot_size(pair)
+                        # Every batch of at least max_qty adjusts to the same size, so compute it once
+                        full_batch = None
+                        if max_qty != float('inf'):
+                            full_batch = self.client.adjust_quantity(pair, max_qty, is_market_order=True)
                         
                         remaining = free_amt
                         total_sold = 0.0
                         
                         # Sell in batches if quantity exceeds max
                         while remaining > 0:
-                            qty_to_sell = self.client.adjust_quantity(pair, remaining, is_market_order=True)
+                            if full_batch is not None and remaining >= max_qty:
+                                qty_to_sell = full_batch
+                            else:
+                                qty_to_sell = self.client.adjust_quantity(pair, remaining, is_market_order=True)
                             
                             if qty_to_sell <= 0 or qty_to_sell < min_qty:
                                 # Remaining quantity below minimum - treat as dust
                                 if total_sold == 0:
-                                    self.add_log(f"Cannot sell {asset_name}: qty {free_amt} below min {min_qty}. Moving to dust.", "warning")
+                                    asset_logs.append((f"Cannot sell {asset_name}: qty {free_amt} below min {min_qty}. Moving to dust.", "warning"))
                                     dust_assets.append((asset_name, remaining, pair))
                                 else:
-                                    self.add_log(f"Remaining {remaining} {asset_name} is dust.", "info")
+                                    asset_logs.append((f"Remaining {remaining} {asset_name} is dust.", "info"))
                                     dust_assets.append((asset_name, remaining, pair))
                                 break
                             
@@ -233,27 +279,27 @@ class GUIHandlers:
                             executed_qty = float(result.get('executedQty', 0))
                             
                             if status == 'EXPIRED' or executed_qty == 0:
-                                self.add_log(f"Cannot sell {asset_name}: No liquidity on testnet.", "warning")
+                                asset_logs.append((f"Cannot sell {asset_name}: No liquidity on testnet.", "warning"))
                                 break  # No point retrying, no buyers
                             
                             total_sold += executed_qty
                             remaining -= executed_qty
-                            self.add_log(f"Sold {executed_qty} {asset_name}", "success")
+                            asset_logs.append((f"Sold {executed_qty} {asset_name}", "success"))
                             
-                            # Small delay between batch sells
-                            if remaining > 0 and remaining >= min_qty:
-                                time.sleep(0.3)
-                            else:
+                            # Order pacing is left to the client's ORDERS rate limiter
+                            if remaining <= 0 or remaining < min_qty:
                                 if remaining > 0:
                                     dust_assets.append((asset_name, remaining, pair))
                                 break
                         
                     except BinanceClientError as e:
                         if e.is_market_lot_size_error() or e.is_lot_size_error():
-                            self.add_log(f"Cannot sell {asset_name}: lot size error. Moving to dust.", "warning")
+                            asset_logs.append((f"Cannot sell {asset_name}: lot size error. Moving to dust.", "warning"))
                             dust_assets.append((asset_name, free_amt, pair))
                         else:
-                            self.add_log(f"Failed to sell {asset_name}: {e}", "error")
+                            asset_logs.append((f"Failed to sell {asset_name}: {e}", "error"))
+                    finally:
+                        self.add_logs(asset_logs)
             
             # Pass 2: Sweep Dust
             if dust_assets:
@@ -262,11 +308,8 @@ class GUIHandlers:
                 
                 # Get fresh USDT balance
                 account = self.client.get_account_info()
-                usdt_balance = 0.0
-                for b in account['balances']:
-                    if b['asset'] == 'USDT':
-                        usdt_balance = float(b['free'])
-                        break
+                usdt = self.client.get_balances_by_asset(account).get('USDT')
+                usdt_balance = float(usdt['free']) if usdt else 0.0
                 
                 for i, (asset_name, free_amt, pair) in enumerate(dust_assets):
                     update_status(f"Sweeping {asset_name} ({i+1}/{len(dust_assets)})...")
@@ -290,16 +333,10 @@ class GUIHandlers:
                             continue
                         
                         self.add_log(f"Bought ~11 USDT of {asset_name} to enable sell.", "info")
+                        # Track the USDT balance locally instead of re-fetching the account
+                        usdt_balance -= float(buy_result.get('cummulativeQuoteQty', 11.0))
                         
-                        time.sleep(0.5)
-                        
-                        # Get new balance
-                        sub_acc = self.client.get_account_info()
-                        new_bal = 0.0
-                        for b in sub_acc['balances']:
-                            if b['asset'] == asset_name:
-                                new_bal = float(b['free'])
-                                break
+                        new_bal = self._balance_after_buy(asset_name, free_amt, buy_result)
                         
                         # Sell everything
                         qty_to_sell = self.client.adjust_quantity(pair, new_bal, is_market_order=True)
@@ -315,6 +352,7 @@ class GUIHandlers:
                                 self.add_log(f"Failed to sell {asset_name}: No liquidity for sell.", "warning")
                             else:
                                 executed = float(sell_result.get('executedQty', 0))
+                                usdt_balance += float(sell_result.get('cummulativeQuoteQty', 0))
                                 self.add_log(f"Swept dust: Sold {executed} {asset_name}", "success")
                         else:
                             self.add_log(f"Failed to sweep {asset_name}: Adjusted quantity is 0.", "error")
@@ -335,9 +373,22 @@ class GUIHandlers:
             return False
     
 
+    def _balance_after_buy(self, asset: str, held: float, buy_result: dict) -> float:
+        """Balance of an asset after a filled market buy, derived from the fills when possible."""
+        fills = buy_result.get('fills')
+        if fills is None:
+            # ACK/RESULT responses carry no fills: wait for the balance to settle and re-read it
+            time.sleep(0.5)
+            entry = self.client.get_balances_by_asset(self.client.get_account_info()).get(asset)
+            return float(entry['free']) if entry else 0.0
+        
+        fee = sum(float(f['commission']) for f in fills if f.get('commissionAsset') == asset)
+        return held + float(buy_result['executedQty']) - fee
+    
+
     # ========== Asset Selection Handler ==========
     
-    def handle_asset_selection(self, selected_asset: str, all_symbols: list[str]):
+    def handle_asset_selection(self, selected_asset: str, all_symbols: Collection[str]):
         potential_pair = f"{selected_asset}USDT"
         if potential_pair in all_symbols:
             st.session_state["symbol_select"] = potential_pair
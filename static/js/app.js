@@ -7,7 +7,7 @@
 let currentSymbol = 'BTCUSDT';
 let currentPrice = 0;
 let availableBalance = 0;
-let autoRefreshInterval = null;
+let eventSource = null;
 
 // ========== Initialization ==========
 
@@ -87,8 +87,12 @@ document.addEventListener('DOMContentLoaded', function() {
         refreshAll();
     }
     
-    // Start auto-refresh (every 30 seconds)
-    startAutoRefresh();
+    // Subscribe to server-pushed updates (log, open orders, price)
+    startEventStream();
+    
+    // Slow fallback for exchange-side fills when the user data stream, and with it
+    // the pushed 'orders' events, is unavailable
+    setInterval(refreshOpenOrders, 30000);
 });
 
 // ========== Configuration Management ==========
@@ -152,16 +156,34 @@ function unhideAsset(asset) {
     });
 }
 
-// ========== Auto Refresh ==========
+// ========== Live Updates ==========
 
-function startAutoRefresh() {
-    if (autoRefreshInterval) {
-        clearInterval(autoRefreshInterval);
+function startEventStream() {
+    if (eventSource) {
+        eventSource.close();
     }
-    autoRefreshInterval = setInterval(function() {
-        refreshPrice();
+    // EventSource reconnects on its own if the connection drops
+    eventSource = new EventSource(`/api/stream?symbol=${encodeURIComponent(currentSymbol)}`);
+    
+    eventSource.addEventListener('log', function(e) {
+        prependLogEntry(JSON.parse(e.data));
+    });
+    
+    eventSource.addEventListener('orders', function() {
         refreshOpenOrders();
-    }, 30000);
+    });
+    
+    eventSource.addEventListener('price', function(e) {
+        const data = JSON.parse(e.data);
+        if (data.symbol !== currentSymbol) return;
+        
+        // Only update the display; leave the buy/sell price inputs as the user set them
+        currentPrice = data.price;
+        document.getElementById('current-price').value = data.formatted;
+        if (window.prices) {
+            window.prices[currentSymbol] = data.price;
+        }
+    });
 }
 
 // ========== Symbol Management ==========
@@ -178,6 +200,11 @@ function onSymbolChange() {
     
     refreshPrice();
     updateAvailableBalance();
+    
+    // Re-subscribe so the stream pushes the newly selected symbol's price
+    if (eventSource) {
+        startEventStream();
+    }
 }
 
 function filterSymbols() {
@@ -292,7 +319,8 @@ function setMaxSellQuantity() {
 function refreshAll() {
     showToast('Refreshing data...', 'info');
     
-    fetch('/api/refresh')
+    // One round trip for portfolio, open orders, log and the selected price
+    fetch(`/api/dashboard?refresh=1&symbol=${encodeURIComponent(currentSymbol)}`)
         .then(response => response.json())
         .then(data => {
             if (data.error) {
@@ -301,19 +329,24 @@ function refreshAll() {
             }
             
             // Update portfolio summary
-            document.getElementById('usdt-balance').textContent = data.usdt_balance;
-            document.getElementById('portfolio-value').textContent = data.portfolio_value;
+            const portfolio = data.portfolio;
+            document.getElementById('usdt-balance').textContent = portfolio.usdt_balance;
+            document.getElementById('portfolio-value').textContent = portfolio.portfolio_value;
             
             // Update assets table
-            updateAssetsTable(data.assets);
+            updateAssetsTable(portfolio.assets);
             
             // Update symbols list
-            window.allSymbols = data.all_symbols;
+            window.allSymbols = portfolio.all_symbols;
             filterSymbols();
             
-            // Refresh other components
-            refreshOpenOrders();
-            refreshActivityLog();
+            // Update other components
+            renderOpenOrders(data.open_orders);
+            renderActivityLog(data.log);
+            if (data.price) {
+                currentPrice = data.price.price;
+                document.getElementById('current-price').value = data.price.formatted;
+            }
             
             showToast('Data refreshed', 'success');
         })
@@ -367,42 +400,44 @@ function filterAssetTable() {
 function refreshOpenOrders() {
     fetch('/api/open_orders')
         .then(response => response.json())
-        .then(data => {
-            const tbody = document.querySelector('#open-orders-table tbody');
-            const noOrders = document.getElementById('no-open-orders');
-            
-            if (!data.orders || data.orders.length === 0) {
-                tbody.innerHTML = '';
-                noOrders.style.display = 'block';
-                return;
-            }
-            
-            noOrders.style.display = 'none';
-            tbody.innerHTML = '';
-            
-            data.orders.forEach(order => {
-                const tr = document.createElement('tr');
-                tr.innerHTML = `
-                    <td>${order.symbol}</td>
-                    <td>${order.orderId}</td>
-                    <td class="${order.side === 'BUY' ? 'text-success' : 'text-danger'}">${order.side}</td>
-                    <td>${order.type}</td>
-                    <td>${order.price}</td>
-                    <td>${order.origQty}</td>
-                    <td>${order.executedQty}</td>
-                    <td>
-                        <button class="btn btn-sm btn-outline-danger" 
-                                onclick="cancelOrder('${order.symbol}', '${order.orderId}')">
-                            Cancel
-                        </button>
-                    </td>
-                `;
-                tbody.appendChild(tr);
-            });
-        })
+        .then(data => renderOpenOrders(data.orders))
         .catch(err => console.error('Failed to fetch open orders:', err));
 }
 
+function renderOpenOrders(orders) {
+    const tbody = document.querySelector('#open-orders-table tbody');
+    const noOrders = document.getElementById('no-open-orders');
+    
+    if (!orders || orders.length === 0) {
+        tbody.innerHTML = '';
+        noOrders.style.display = 'block';
+        return;
+    }
+    
+    noOrders.style.display = 'none';
+    tbody.innerHTML = '';
+    
+    orders.forEach(order => {
+        const tr = document.createElement('tr');
+        tr.innerHTML = `
+            <td>${order.symbol}</td>
+            <td>${order.orderId}</td>
+            <td class="${order.side === 'BUY' ? 'text-success' : 'text-danger'}">${order.side}</td>
+            <td>${order.type}</td>
+            <td>${order.price}</td>
+            <td>${order.origQty}</td>
+            <td>${order.executedQty}</td>
+            <td>
+                <button class="btn btn-sm btn-outline-danger" 
+                        onclick="cancelOrder('${order.symbol}', '${order.orderId}')">
+                    Cancel
+                </button>
+            </td>
+        `;
+        tbody.appendChild(tr);
+    });
+}
+
 function cancelOrder(symbol, orderId) {
     if (!confirm(`Cancel order ${orderId}?`)) return;
     
@@ -416,7 +451,6 @@ function cancelOrder(symbol, orderId) {
         if (data.success) {
             showToast('Order cancelled', 'success');
             refreshOpenOrders();
-            refreshActivityLog();
         } else {
             showToast(data.error || 'Failed to cancel order', 'error');
         }
@@ -509,7 +543,8 @@ function placeBuyOrder(event) {
         order_type: orderType,
         quantity: quantity,
         total_usdt: totalUsdt,
-        price: price
+        price: price,
+        current_price: currentPrice
     };
     
     // Show loading state
@@ -561,7 +596,6 @@ function placeBuyOrder(event) {
         console.log('Request complete, resetting button');
         btn.disabled = false;
         btn.innerHTML = originalText;
-        refreshActivityLog();
     });
 }
 
@@ -618,7 +652,6 @@ function placeSellOrder(event) {
     .finally(() => {
         btn.disabled = false;
         btn.innerHTML = originalText;
-        refreshActivityLog();
     });
 }
 
@@ -645,7 +678,6 @@ function resetPortfolio() {
         } else {
             showToast(result.error || 'Reset failed', 'error');
         }
-        refreshActivityLog();
     })
     .catch(err => {
         showToast('Reset failed', 'error');
@@ -663,28 +695,53 @@ function resetPortfolio() {
 function refreshActivityLog() {
     fetch('/api/activity_log')
         .then(response => response.json())
-        .then(data => {
-            const container = document.getElementById('activity-log');
-            container.innerHTML = '';
-            
-            if (!data.log || data.log.length === 0) {
-                container.innerHTML = '<div class="p-3 text-muted">No activity yet.</div>';
-                return;
-            }
-            
-            data.log.forEach(entry => {
-                const div = document.createElement('div');
-                div.className = `log-entry log-${entry.level}`;
-                div.innerHTML = `
-                    <span class="log-time">[${entry.time}]</span>
-                    <span class="log-msg">${entry.msg}</span>
-                `;
-                container.appendChild(div);
-            });
-        })
+        .then(data => renderActivityLog(data.log))
         .catch(err => console.error('Failed to fetch activity log:', err));
 }
 
+function renderActivityLog(log) {
+    const container = document.getElementById('activity-log');
+    container.innerHTML = '';
+    
+    if (!log || log.length === 0) {
+        container.innerHTML = '<div class="p-3 text-muted">No activity yet.</div>';
+        return;
+    }
+    
+    log.forEach(entry => {
+        container.appendChild(createLogEntry(entry));
+    });
+}
+
+function createLogEntry(entry) {
+    const div = document.createElement('div');
+    div.className = `log-entry log-${entry.level}`;
+    div.dataset.id = entry.id;
+    div.innerHTML = `
+        <span class="log-time">[${entry.time}]</span>
+        <span class="log-msg">${entry.msg}</span>
+    `;
+    return div;
+}
+
+function prependLogEntry(entry) {
+    const container = document.getElementById('activity-log');
+    if (!container) return;
+    // A full re-render may already have shown this entry
+    if (container.querySelector(`[data-id="${entry.id}"]`)) return;
+    
+    // Drop the "No activity yet." placeholder
+    if (!container.querySelector('.log-entry')) {
+        container.innerHTML = '';
+    }
+    container.prepend(createLogEntry(entry));
+    
+    // Match the server-side log length
+    while (container.children.length > 50) {
+        container.lastElementChild.remove();
+    }
+}
+
 // ========== Toast Notifications ==========
 
 function showToast(message, type = 'info') {
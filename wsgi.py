@@ -0,0 +1,7 @@
+"""
+WSGI entry point for running the Flask app under a production server, e.g.
+
+    gunicorn -k gthread -w 1 --threads 16 -b 0.0.0.0:5000 wsgi:app
+"""
+
+from app import app